@@ -2,21 +2,36 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Dict, Iterable, List, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 import hashlib
+import heapq
 import random
 import re
 from io import BytesIO
 
 from nltk.corpus import stopwords
-import matplotlib.pyplot as plt
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.enums import TA_JUSTIFY
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import Image, KeepTogether, ListFlowable, ListItem, PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from reportlab.platypus import Image, KeepTogether, ListFlowable, ListItem, LongTable, PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+
+# Same boundaries as str.splitlines()
+_LINE_BREAK_PATTERN = re.compile(r"\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+_SENTENCE_SPLIT_PATTERN = re.compile(r"[.;?!]")
+# Word tokens; runs of \w are already bounded by \b on both sides. ASCII text
+# can use the ASCII class, which finds the same tokens more cheaply.
+_WORD_PATTERN = re.compile(r"\w+")
+_ASCII_WORD_PATTERN = re.compile(r"\w+", re.ASCII)
 
 
 @dataclass(frozen=True)
@@ -55,6 +70,23 @@ class CloudMetadata:
     prefer_horizontal: Optional[float]
 
 
+@dataclass(slots=True)
+class InsightSection:
+    """Availability and per-term items of one top-word insight section."""
+    available: bool = False
+    reason: str = "N/A"
+    items: Mapping[str, list] = field(default_factory=dict)
+    note: Optional[str] = None
+
+
+@dataclass(slots=True)
+class TopWordInsights:
+    """Top terms with their most common bigrams and context examples."""
+    top_terms: List[str]
+    bigrams: InsightSection
+    examples: InsightSection
+
+
 def build_report_data(
     frequencies: Dict[str, float],
     *,
@@ -687,18 +719,18 @@ def _render_hapax_summary_pdf(analysis: Optional[Dict[str, object]], labels: Dic
 
 
 def _render_top_word_bigrams(report_data: Dict[str, object], labels: Dict[str, str]) -> List[str]:
-    insights = report_data.get("top_word_insights", {})
-    bigrams_info = insights.get("bigrams", {})
-    if not bigrams_info or not bigrams_info.get("available"):
-        reason = bigrams_info.get("reason") if bigrams_info else labels["not_available"]
+    insights: Optional[TopWordInsights] = report_data.get("top_word_insights")  # type: ignore[assignment]
+    bigrams_info = insights.bigrams if insights else None
+    if not bigrams_info or not bigrams_info.available:
+        reason = bigrams_info.reason if bigrams_info else labels["not_available"]
         return [f"{labels['not_available']}: {reason}"]
 
-    items = bigrams_info.get("items", {})
+    items = bigrams_info.items
     if not items:
         return [labels["no_data"]]
 
     lines: List[str] = []
-    note = bigrams_info.get("note")
+    note = bigrams_info.note
     if note:
         lines.append(f"{labels['note']}: {note}")
     for word, bigrams in items.items():
@@ -712,21 +744,24 @@ def _render_top_word_bigrams(report_data: Dict[str, object], labels: Dict[str, s
 
 
 def _render_top_word_examples(report_data: Dict[str, object], labels: Dict[str, str]) -> List[str]:
-    insights = report_data.get("top_word_insights", {})
-    examples_info = insights.get("examples", {})
-    if not examples_info or not examples_info.get("available"):
-        reason = examples_info.get("reason") if examples_info else labels["not_available"]
+    insights: Optional[TopWordInsights] = report_data.get("top_word_insights")  # type: ignore[assignment]
+    examples_info = insights.examples if insights else None
+    if not examples_info or not examples_info.available:
+        reason = examples_info.reason if examples_info else labels["not_available"]
         return [f"{labels['not_available']}: {reason}"]
 
-    items = examples_info.get("items", {})
-    if not items:
+    # Terms without examples are omitted from "items", so walk the top terms
+    top_terms = insights.top_terms or []
+    if not top_terms:
         return [labels["no_data"]]
 
+    items = examples_info.items
     lines: List[str] = []
-    note = examples_info.get("note")
+    note = examples_info.note
     if note:
         lines.append(f"{labels['note']}: {note}")
-    for word, examples in items.items():
+    for word in dict.fromkeys(top_terms):
+        examples = items.get(word, [])
         lines.append(f"{word}:")
         if not examples:
             lines.append(f"  {labels['no_examples_found']}")
@@ -922,7 +957,7 @@ def _pdf_summary_table(report_data: Dict[str, object], labels: Dict[str, str]) -
             _format_percent(lemma_analysis["concentration"].get(20, {"percent_of_total": 0.0})["percent_of_total"]) if lemma_analysis else labels["na"],
         ])
 
-    table = Table(rows, colWidths=[200, 140, 140], splitByRow=0)
+    table = LongTable(rows, colWidths=[200, 140, 140], repeatRows=1)
     table.setStyle(
         TableStyle(
             [
@@ -953,7 +988,7 @@ def _pdf_token_stats_table(report_data: Dict[str, object], labels: Dict[str, str
             _format_number(entry["total_tokens"]),
             _format_number(entry["unique_tokens"]),
         ])
-    table = Table(rows, colWidths=[220, 140, 140], splitByRow=0)
+    table = LongTable(rows, colWidths=[220, 140, 140], repeatRows=1)
     table.setStyle(
         TableStyle(
             [
@@ -994,7 +1029,7 @@ def _pdf_core_stats_table(analysis: Optional[Dict[str, object]], labels: Dict[st
         [labels["shortest_hapax"], _format_tokens_with_length(hapax_stats["hapax_shortest"], labels)],
         [labels["longest_hapax"], _format_tokens_with_length(hapax_stats["hapax_longest"], labels)],
     ]
-    table = Table(rows, colWidths=[230, 250], splitByRow=0)
+    table = LongTable(rows, colWidths=[230, 250])
     table.setStyle(
         TableStyle(
             [
@@ -1064,18 +1099,18 @@ def _pdf_token_extremes_table(analysis: Optional[Dict[str, object]], labels: Dic
 
 
 def _pdf_top_word_insights_table(report_data: Dict[str, object], labels: Dict[str, str]) -> Table:
-    insights = report_data.get("top_word_insights", {})
-    bigrams_info = insights.get("bigrams", {})
-    examples_info = insights.get("examples", {})
-    top_terms = insights.get("top_terms") or []
+    insights: Optional[TopWordInsights] = report_data.get("top_word_insights")  # type: ignore[assignment]
+    bigrams_items = insights.bigrams.items if insights else {}
+    examples_items = insights.examples.items if insights else {}
+    top_terms = (insights.top_terms if insights else None) or []
 
     rows = [[labels["word_header"], labels["bigrams_header"], labels["examples_header"]]]
     for term in top_terms:
-        bigrams = bigrams_info.get("items", {}).get(term, [])
+        bigrams = bigrams_items.get(term, [])
         bigram_text = "<br/>".join(
             [f"{entry['bigram']} ({_format_number(entry['count'])})" for entry in bigrams]
         ) or labels["no_examples_found"]
-        examples = examples_info.get("items", {}).get(term, [])
+        examples = examples_items.get(term, [])
         example_text = "<br/>".join(examples) or labels["no_examples_found"]
         rows.append([term, Paragraph(bigram_text, getSampleStyleSheet()["BodyText"]), Paragraph(example_text, getSampleStyleSheet()["BodyText"])])
 
@@ -1228,7 +1263,7 @@ def _pdf_top_words_table(analysis: Optional[Dict[str, object]], labels: Dict[str
             _format_number(item["frequency"]), 
             _format_percent(item["percent"])
         ])
-    table = Table(rows, colWidths=[24, 180, 80, 80], splitByRow=0)
+    table = LongTable(rows, colWidths=[24, 180, 80, 80], repeatRows=1)
     table.setStyle(
         TableStyle(
             [
@@ -1255,7 +1290,7 @@ def _pdf_top_words_with_concentration_table(analysis: Optional[Dict[str, object]
             _format_number(item["frequency"]), 
             _format_percent(item["percent"])
         ])
-    table = Table(rows, colWidths=[24, 180, 80, 80], splitByRow=0)
+    table = LongTable(rows, colWidths=[24, 180, 80, 80], repeatRows=1)
     table.setStyle(
         TableStyle(
             [
@@ -1317,6 +1352,10 @@ def _build_concentration_chart(analysis: Optional[Dict[str, object]], labels: Di
         top10_data["percent_of_total"],
         top20_data["percent_of_total"],
     ]
+    # pyplot is imported lazily: text-only report paths never need it and
+    # loading it (font cache, backend probing) dominates module import time.
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(4.5, 2.2))
     ax.bar(categories, values, color="#4C78A8")
     ax.set_ylim(0, max(values + [1]) * 1.2)
@@ -1395,8 +1434,8 @@ def _safe_percent(freq: float, total: float) -> float:
 def _format_number(value: Optional[float]) -> str:
     if value is None:
         return "N/A"
-    if isinstance(value, bool):
-        return str(value)
+    if type(value) is bool:
+        return "True" if value else "False"
     if abs(value - round(value)) < 1e-9:
         return str(int(round(value)))
     return f"{value:.3f}".rstrip("0").rstrip(".")
@@ -1441,336 +1480,397 @@ def _format_examples_list(tokens: List[str], labels: Dict[str, str], max_items:
     return "\n".join(tokens[:max_items])
 
 
-def _get_report_labels(language: str) -> Dict[str, str]:
-    if language.lower().startswith("es"):
-        return {
-            "title": "Informe Nubisary",
-            "generated_at": "Generado (UTC)",
-            "summary_title": "Resumen",
-            "intro_text": "Este informe ofrece un análisis detallado del vocabulario del texto de entrada. Se presentan métricas comparativas (con y sin lematización), palabras más frecuentes, concentración del vocabulario, hapax legomena (palabras únicas) y metadatos técnicos del procesamiento. El texto analizado proviene del archivo: {source_name}",
-            "summary_intro": "Este apartado ofrece una visión comparativa de las métricas principales del texto, tanto en su forma original como después de aplicar la lematización (reducción de cada palabra a su forma base). Los cálculos se realizaron excluyendo las palabras funcionales habituales (stopwords). En pocas palabras, el cuadro muestra cuántas palabras aparecen en total, cuántas son distintas y cuánta variabilidad léxica contiene el documento.",
-            "token_extremes_intro": "Se indican la longitud más corta y la más larga de los tokens detectados en el corpus, distinguiendo entre palabras que aparecen una sola vez (hapax) y aquellas que se repiten. Este desglose permite identificar rápidamente términos poco frecuentes o de carácter especializado.",
-            "top_words_intro": "Aquí aparecen las veinte palabras con mayor número de apariciones antes de la lematización, acompañadas del recuento exacto y del porcentaje que representan respecto al total de tokens. Esta información revela los conceptos temáticos centrales del texto. Al final de la tabla se muestra cuánto del texto total está cubierto por los 5, 10 y 20 términos más habituales, lo que indica la concentración léxica del documento.",
-            "top_words_insights_intro": "Para cada una de las cinco palabras más frecuentes se presentan ejemplos de bigramas (pares de palabras consecutivas) y fragmentos de contexto donde aparecen. De este modo se muestra cómo se utilizan esas palabras dentro de frases reales y cuál es su relación con otros conceptos del texto.",
-            "concentration_intro": "Esta tabla indica la proporción del total de palabras que está compuesta por los 5, 10 y 20 términos más habituales. Cuando una gran parte del texto está formada por unas pocas palabras, el vocabulario es menos diverso; por el contrario, una cobertura más baja indica una mayor riqueza léxica.",
-            "hapax_intro": "Los hapax legomena (del griego «una sola vez») son palabras que aparecen exactamente una vez en el documento completo. Pueden indicar tanto riqueza léxica como errores tipográficos, nombres propios o términos especializados poco frecuentes.",
-            "hapax_data_intro": "Datos cuantitativos:",
-            "hapax_count_label": "Total de hapax",
-            "hapax_pct_unique_label": "Porcentaje del vocabulario único",
-            "hapax_pct_total_label": "Porcentaje del total de palabras",
-            "hapax_examples_note": "A continuación se muestran ejemplos de los hapax más largos y más cortos para ilustrar esta diversidad:",
-            "metadata_intro": "En este apartado se describen los criterios técnicos empleados para el análisis (idioma, tipo de n-grama, aplicación de lematización, exclusión de stopwords, sensibilidad a mayúsculas, etc.) y la fecha y hora exactas de generación del reporte (UTC). Esta información resulta útil para reproducir el estudio o ajustar la configuración en futuros análisis.",
-            "summary_tokens": "Tokens totales",
-            "summary_unique": "Tokens únicos",
-            "summary_hapax": "Hapax legomena",
-            "summary_top5": "Top 5 palabras",
-            "summary_concentration": "Top 5 palabras concentran",
-            "summary_comparison": "Comparación (lematizado)",
-            "lemmatized_unique_change": "variación de tokens únicos",
-            "scenario_title": "Ajustes de procesamiento",
-            "core_stats_title": "Estadísticas principales",
-            "token_extremes_title": "Análisis de longitud de palabras",
-            "core_including_hapax": "Incluyendo hapax",
-            "core_excluding_hapax": "Excluyendo hapax",
-            "core_hapax_only": "Solo hapax",
-            "top_words_title": "Palabras más frecuentes y su peso en el vocabulario",
-            "top_words_bigrams_title": "Top 5 palabras: bigramas frecuentes",
-            "top_words_examples_title": "Top 5 palabras: ejemplos en contexto",
-            "top_words_insights_title": "Top 5 palabras: bigramas y contexto",
-            "concentration_title": "Concentración del vocabulario",
-            "concentration_summary": "Las 5 palabras más frecuentes cubren el {top5} del texto; las 10 cubren el {top10}; y las 20 cubren el {top20}. (Calculado sobre {total} tokens sin lematizar).",
-            "concentration_intro_text": "A continuación, se muestra el porcentaje que ocupan las palabras más frecuentes respecto al total de tokens y respecto al vocabulario único:",
-            "concentration_top5": "Las 5 palabras más frecuentes: {pct_total} del total, {pct_unique} de únicos",
-            "concentration_top10": "Las 10 palabras más frecuentes: {pct_total} del total, {pct_unique} de únicos",
-            "concentration_top20": "Las 20 palabras más frecuentes: {pct_total} del total, {pct_unique} de únicos",
-            "percent_header": "% del total",
-            "of_unique": "de únicos",
-            "hapax_title": "Hapax legomena (frecuencia = 1)",
-            "comparison_title": "Escenario de comparación",
-            "metric_header": "Métrica",
-            "current_header": "Actual",
-            "comparison_header": "Lematizado",
-            "length_header": "Longitud",
-            "not_lemmatized_header": "Sin lematizar",
-            "lemmatized_header": "Lematizado",
-            "stopwords_included": "incluidas",
-            "stopwords_excluded": "excluidas",
-            "showing_up_to_5": "mostrando hasta 5",
-            "hapax_summary_text": "Hapax legomena: {count} ({pct_unique} {of_unique}, {pct_total} {of_total}). Se incluyen hasta 5 ejemplos de los hapax más largos y más cortos.",
-            "hapax_longest_examples": "Hapax más largos (ejemplos)",
-            "hapax_shortest_examples": "Hapax más cortos (ejemplos)",
-            "word_header": "Palabra",
-            "count_header": "Conteo",
-            "percent_header": "%",
-            "bigrams_header": "Bigramas",
-            "examples_header": "Ejemplos",
-            "top5_short": "Top 5",
-            "top10_short": "Top 10",
-            "top20_short": "Top 20",
-            "percent_label": "Porcentaje",
-            "concentration_chart_title": "Concentración del vocabulario",
-            "top_5_concentration_short": "Top 5",
-            "top_10_concentration_short": "Top 10",
-            "top_20_concentration_short": "Top 20",
-            "hapax_legomena_count": "Hapax (conteo)",
-            "hapax_legomena_pct_unique": "Hapax (% de únicos)",
-            "metadata_title": "Metadatos técnicos",
-            "metadata_scenario_header": "Procesamiento",
-            "metadata_cloud_header": "Nube de palabras",
-        "source_name": "Archivo",
-            "cloud_meta_title": "Parámetros de la nube (informativo)",
-            "token_stats_title": "Conteo de tokens por configuración",
-            "token_stats_header": "Configuración",
-            "token_stats_columns": "Total / Únicos",
-            "lemmatize_short": "Lematizar",
-            "stopwords_short": "Stopwords",
-            "yes": "sí",
-            "no": "no",
-            "label": "Etiqueta",
-            "language": "Idioma",
-            "ngram": "N-grama",
-            "lemmatize": "Lematizar",
-            "include_stopwords": "Incluir stopwords",
-            "include_numbers": "Incluir números",
-            "case_sensitive": "Sensible a mayúsculas",
-            "exclude_words": "Excluir palabras",
-            "exclude_case_sensitive": "Exclusión sensible a mayúsculas",
-            "regex_rule": "Regla regex",
-            "regex_case_sensitive": "Regex sensible a mayúsculas",
-            "replace_stage": "Etapa de reemplazo",
-            "none": "Ninguno",
-            "na": "N/A",
-            "no_data": "Sin datos disponibles.",
-            "not_available": "No disponible",
-            "warning": "Aviso",
-            "note": "Nota",
-            "no_examples_found": "No se encontraron ejemplos.",
-            "total_tokens": "Tokens totales",
-            "unique_tokens": "Tokens únicos",
-            "variability_ratio": "Ratio de variabilidad del vocabulario (unique/total)",
-            "variability_ratio_short": "Ratio de variabilidad (unique/total)",
-            "hapax_legomena": "Hapax legomena",
-            "avg_token_length": "Longitud media de token",
-            "median_token_length": "Longitud mediana de token",
-            "avg_token_length_non_hapax": "Longitud media (excluyendo hapax)",
-            "median_token_length_non_hapax": "Longitud mediana (excluyendo hapax)",
-            "avg_token_length_hapax": "Longitud media (solo hapax)",
-            "median_token_length_hapax": "Longitud mediana (solo hapax)",
-            "avg_token_length_short": "Longitud media",
-            "median_token_length_short": "Longitud mediana",
-            "shortest_token": "Token más corto",
-            "longest_token": "Token más largo",
-            "shortest_non_hapax": "Token más corto (excluyendo hapax)",
-            "longest_non_hapax": "Token más largo (excluyendo hapax)",
-            "shortest_hapax": "Token más corto (solo hapax)",
-            "longest_hapax": "Token más largo (solo hapax)",
-            "of_unique": "de tokens únicos",
-            "of_total": "del total",
-            "top_5_concentration": "Las 5 palabras más frecuentes suman",
-            "top_10_concentration": "Las 10 palabras más frecuentes suman",
-            "top_20_concentration": "Las 20 palabras más frecuentes suman",
-            "of_all_tokens": "del total de tokens.",
-            "count": "Cantidad",
-            "sample_up_to_20": "Ejemplo (hasta 20)",
-            "longest_hapax_tokens": "Hapax más largo(s)",
-            "comparison_summary_title": "Resumen rápido vs escenario actual:",
-            "cloud_meta_na": "No aplica (análisis standalone).",
-            "max_words": "Máx. palabras",
-            "min_word_length": "Longitud mínima",
-            "canvas_size": "Tamaño del lienzo",
-            "theme": "Tema",
-            "colormap": "Colormap",
-            "background": "Fondo",
-            "font_color": "Color de fuente",
-            "relative_scaling": "Escalado relativo",
-            "prefer_horizontal": "Preferencia horizontal",
-            "mask": "Máscara",
-            "contour_width": "Ancho de contorno",
-            "contour_color": "Color de contorno",
-            "font_path": "Ruta de fuente",
-            "chars": "caracteres",
-            "showing_up_to_3": "mostrando hasta 3",
-            "glossary_title": "Glosario",
-            "glossary_token_term": "Token",
-            "glossary_token_def": "Unidad mínima de texto analizada. En este contexto, generalmente equivale a una palabra después del procesamiento (limpieza, exclusión de stopwords, etc.).",
-            "glossary_lemmatization_term": "Lematización",
-            "glossary_lemmatization_def": "Proceso de reducir cada palabra a su forma base o lema. Por ejemplo, 'corriendo', 'corrió' y 'correr' se agrupan bajo el lema 'correr'.",
-            "glossary_stopwords_term": "Stopwords",
-            "glossary_stopwords_def": "Palabras funcionales muy comunes (como 'el', 'la', 'de', 'y') que suelen excluirse del análisis porque no aportan información temática relevante.",
-            "glossary_hapax_term": "Hapax legomena",
-            "glossary_hapax_def": "Palabras que aparecen una única vez en todo el texto. Su prevalencia indica la diversidad léxica del documento.",
-            "glossary_bigram_term": "Bigrama",
-            "glossary_bigram_def": "Par de palabras consecutivas en el texto. Por ejemplo, en 'cielo azul', el bigrama es ('cielo', 'azul').",
-            "glossary_variability_term": "Ratio de variabilidad",
-            "glossary_variability_def": "Proporción entre el número de palabras distintas (tipos) y el total de palabras (tokens). Un ratio alto indica mayor riqueza léxica.",
-        }
+_EN_LABELS: Mapping[str, str] = MappingProxyType({
+    "title": "Nubisary Report",
+    "generated_at": "Generated (UTC)",
+    "summary_title": "Summary",
+    "intro_text": "This report provides a detailed analysis of the vocabulary in the input text. It presents comparative metrics (with and without lemmatization), most frequent words, vocabulary concentration, hapax legomena (unique words), and technical metadata of the processing. The analyzed text comes from the file: {source_name}",
+    "summary_intro": "This section offers a comparative overview of the text's main metrics, both in its original form and after applying lemmatization (reducing each word to its base form). Calculations were performed excluding common functional words (stopwords). In short, the table shows how many words appear in total, how many are distinct, and how much lexical variability the document contains.",
+    "token_extremes_intro": "The shortest and longest token lengths detected in the corpus are indicated, distinguishing between words that appear only once (hapax) and those that are repeated. This breakdown allows for quick identification of infrequent or specialized terms.",
+    "top_words_intro": "Here are the twenty words with the highest number of occurrences before lemmatization, accompanied by the exact count and the percentage they represent of the total tokens. This information reveals the central thematic concepts of the text. At the end of the table, the cumulative coverage of the top 5, 10, and 20 most common terms is shown, indicating the lexical concentration of the document.",
+    "top_words_insights_intro": "For each of the five most frequent words, examples of bigrams (consecutive word pairs) and context fragments where they appear are presented. This shows how these words are used within real sentences and their relationship with other concepts in the text.",
+    "concentration_intro": "This table indicates the proportion of total words that is composed of the 5, 10, and 20 most common terms. When a large part of the text is formed by a few words, the vocabulary is less diverse; conversely, lower coverage indicates greater lexical richness.",
+    "hapax_intro": "Hapax legomena (from Greek «only once») are words that appear exactly once in the complete document. They can indicate both lexical richness and typographical errors, proper names, or infrequent specialized terms.",
+    "hapax_data_intro": "Quantitative data:",
+    "hapax_count_label": "Total hapax",
+    "hapax_pct_unique_label": "Percentage of unique vocabulary",
+    "hapax_pct_total_label": "Percentage of total words",
+    "hapax_examples_note": "Below are examples of the longest and shortest hapax to illustrate this diversity:",
+    "metadata_intro": "This section describes the technical criteria used for the analysis (language, n-gram type, lemmatization application, stopwords exclusion, case sensitivity, etc.) and the exact date and time of report generation (UTC). This information is useful for reproducing the study or adjusting the configuration in future analyses.",
+    "summary_tokens": "Total tokens",
+    "summary_unique": "Unique tokens",
+    "summary_hapax": "Hapax legomena",
+    "summary_top5": "Top 5 words",
+    "summary_concentration": "Top 5 words concentration",
+    "summary_comparison": "Comparison (lemmatized)",
+    "lemmatized_unique_change": "unique tokens change",
+    "scenario_title": "Processing Settings",
+    "core_stats_title": "Core Statistics",
+    "token_extremes_title": "Word Length Analysis",
+    "core_including_hapax": "Including hapax",
+    "core_excluding_hapax": "Excluding hapax",
+    "core_hapax_only": "Hapax only",
+    "top_words_title": "Most Frequent Words and Their Weight in the Vocabulary",
+    "top_words_bigrams_title": "Top 5 Words: Common Bigrams",
+    "top_words_examples_title": "Top 5 Words: Context Examples",
+    "top_words_insights_title": "Top 5 Words: Bigrams & Context",
+    "concentration_title": "Vocabulary Concentration",
+    "concentration_summary": "The top 5 most frequent words cover {top5} of the text; the top 10 cover {top10}; and the top 20 cover {top20}. (Calculated over {total} tokens without lemmatization).",
+    "concentration_intro_text": "The following percentages show the coverage of the most frequent words relative to total tokens and unique vocabulary:",
+    "concentration_top5": "The top 5 most frequent words: {pct_total} of total, {pct_unique} of unique",
+    "concentration_top10": "The top 10 most frequent words: {pct_total} of total, {pct_unique} of unique",
+    "concentration_top20": "The top 20 most frequent words: {pct_total} of total, {pct_unique} of unique",
+    "hapax_title": "Hapax Legomena (frequency = 1)",
+    "comparison_title": "Comparison Scenario",
+    "metric_header": "Metric",
+    "current_header": "Current",
+    "comparison_header": "Lemmatized",
+    "length_header": "Length",
+    "not_lemmatized_header": "Not lemmatized",
+    "lemmatized_header": "Lemmatized",
+    "stopwords_included": "included",
+    "stopwords_excluded": "excluded",
+    "showing_up_to_5": "showing up to 5",
+    "hapax_summary_text": "Hapax legomena: {count} ({pct_unique} {of_unique}, {pct_total} {of_total}). Up to 5 examples of the longest and shortest hapax are included.",
+    "hapax_longest_examples": "Longest hapax (examples)",
+    "hapax_shortest_examples": "Shortest hapax (examples)",
+    "word_header": "Word",
+    "count_header": "Count",
+    "percent_header": "%",
+    "bigrams_header": "Bigrams",
+    "examples_header": "Examples",
+    "top5_short": "Top 5",
+    "top10_short": "Top 10",
+    "top20_short": "Top 20",
+    "percent_label": "Percent",
+    "concentration_chart_title": "Vocabulary Concentration",
+    "top_5_concentration_short": "Top 5",
+    "top_10_concentration_short": "Top 10",
+    "top_20_concentration_short": "Top 20",
+    "hapax_legomena_count": "Hapax (count)",
+    "hapax_legomena_pct_unique": "Hapax (% of unique)",
+    "metadata_title": "Technical Metadata",
+    "metadata_scenario_header": "Processing",
+    "metadata_cloud_header": "Word Cloud",
+    "source_name": "Source file",
+    "cloud_meta_title": "Word Cloud Settings (informational)",
+    "token_stats_title": "Token counts by configuration",
+    "token_stats_header": "Configuration",
+    "token_stats_columns": "Total / Unique",
+    "lemmatize_short": "Lemmatize",
+    "stopwords_short": "Stopwords",
+    "yes": "yes",
+    "no": "no",
+    "label": "Label",
+    "language": "Language",
+    "ngram": "N-gram",
+    "lemmatize": "Lemmatize",
+    "include_stopwords": "Include stopwords",
+    "include_numbers": "Include numbers",
+    "case_sensitive": "Case sensitive",
+    "exclude_words": "Exclude words",
+    "exclude_case_sensitive": "Exclude case sensitive",
+    "regex_rule": "Regex rule",
+    "regex_case_sensitive": "Regex case sensitive",
+    "replace_stage": "Replace stage",
+    "none": "None",
+    "na": "N/A",
+    "no_data": "No data available.",
+    "not_available": "Not available",
+    "warning": "Warning",
+    "note": "Note",
+    "no_examples_found": "No examples found.",
+    "total_tokens": "Total tokens",
+    "unique_tokens": "Unique tokens",
+    "variability_ratio": "Vocabulary variability ratio (unique/total)",
+    "variability_ratio_short": "Vocabulary variability ratio",
+    "hapax_legomena": "Hapax legomena",
+    "avg_token_length": "Average token length",
+    "median_token_length": "Median token length",
+    "avg_token_length_non_hapax": "Average token length (excluding hapax)",
+    "median_token_length_non_hapax": "Median token length (excluding hapax)",
+    "avg_token_length_hapax": "Average token length (hapax only)",
+    "median_token_length_hapax": "Median token length (hapax only)",
+    "avg_token_length_short": "Average token length",
+    "median_token_length_short": "Median token length",
+    "shortest_token": "Shortest token",
+    "longest_token": "Longest token",
+    "shortest_non_hapax": "Shortest token (excluding hapax)",
+    "longest_non_hapax": "Longest token (excluding hapax)",
+    "shortest_hapax": "Shortest token (hapax only)",
+    "longest_hapax": "Longest token (hapax only)",
+    "of_unique": "of unique tokens",
+    "of_total": "of total",
+    "top_5_concentration": "Top 5 words account for",
+    "top_10_concentration": "Top 10 words account for",
+    "top_20_concentration": "Top 20 words account for",
+    "of_all_tokens": "of all tokens.",
+    "count": "Count",
+    "sample_up_to_20": "Sample (up to 20)",
+    "longest_hapax_tokens": "Longest hapax token(s)",
+    "comparison_summary_title": "Quick comparison vs current scenario:",
+    "cloud_meta_na": "Not applicable (standalone analysis).",
+    "max_words": "Max words",
+    "min_word_length": "Min word length",
+    "canvas_size": "Canvas size",
+    "theme": "Theme",
+    "colormap": "Colormap",
+    "background": "Background",
+    "font_color": "Font color",
+    "relative_scaling": "Relative scaling",
+    "prefer_horizontal": "Prefer horizontal",
+    "mask": "Mask",
+    "contour_width": "Contour width",
+    "contour_color": "Contour color",
+    "font_path": "Font path",
+    "chars": "chars",
+    "showing_up_to_3": "showing up to 3",
+    "glossary_title": "Glossary",
+    "glossary_token_term": "Token",
+    "glossary_token_def": "Minimum unit of text analyzed. In this context, it generally corresponds to a word after processing (cleaning, stopwords exclusion, etc.).",
+    "glossary_lemmatization_term": "Lemmatization",
+    "glossary_lemmatization_def": "Process of reducing each word to its base or dictionary form (lemma). For example, 'running', 'ran', and 'run' are grouped under the lemma 'run'.",
+    "glossary_stopwords_term": "Stopwords",
+    "glossary_stopwords_def": "Very common functional words (such as 'the', 'a', 'of', 'and') that are usually excluded from analysis because they do not provide relevant thematic information.",
+    "glossary_hapax_term": "Hapax legomena",
+    "glossary_hapax_def": "Words that appear only once in the entire text. Their prevalence indicates the lexical diversity of the document.",
+    "glossary_bigram_term": "Bigram",
+    "glossary_bigram_def": "Pair of consecutive words in the text. For example, in 'blue sky', the bigram is ('blue', 'sky').",
+    "glossary_variability_term": "Variability ratio",
+    "glossary_variability_def": "Proportion between the number of distinct words (types) and the total number of words (tokens). A high ratio indicates greater lexical richness.",
+})
+
+# Spanish translations; any key not listed here falls back to English.
+_ES_OVERLAY: Dict[str, str] = {
+    "title": "Informe Nubisary",
+    "generated_at": "Generado (UTC)",
+    "summary_title": "Resumen",
+    "intro_text": "Este informe ofrece un análisis detallado del vocabulario del texto de entrada. Se presentan métricas comparativas (con y sin lematización), palabras más frecuentes, concentración del vocabulario, hapax legomena (palabras únicas) y metadatos técnicos del procesamiento. El texto analizado proviene del archivo: {source_name}",
+    "summary_intro": "Este apartado ofrece una visión comparativa de las métricas principales del texto, tanto en su forma original como después de aplicar la lematización (reducción de cada palabra a su forma base). Los cálculos se realizaron excluyendo las palabras funcionales habituales (stopwords). En pocas palabras, el cuadro muestra cuántas palabras aparecen en total, cuántas son distintas y cuánta variabilidad léxica contiene el documento.",
+    "token_extremes_intro": "Se indican la longitud más corta y la más larga de los tokens detectados en el corpus, distinguiendo entre palabras que aparecen una sola vez (hapax) y aquellas que se repiten. Este desglose permite identificar rápidamente términos poco frecuentes o de carácter especializado.",
+    "top_words_intro": "Aquí aparecen las veinte palabras con mayor número de apariciones antes de la lematización, acompañadas del recuento exacto y del porcentaje que representan respecto al total de tokens. Esta información revela los conceptos temáticos centrales del texto. Al final de la tabla se muestra cuánto del texto total está cubierto por los 5, 10 y 20 términos más habituales, lo que indica la concentración léxica del documento.",
+    "top_words_insights_intro": "Para cada una de las cinco palabras más frecuentes se presentan ejemplos de bigramas (pares de palabras consecutivas) y fragmentos de contexto donde aparecen. De este modo se muestra cómo se utilizan esas palabras dentro de frases reales y cuál es su relación con otros conceptos del texto.",
+    "concentration_intro": "Esta tabla indica la proporción del total de palabras que está compuesta por los 5, 10 y 20 términos más habituales. Cuando una gran parte del texto está formada por unas pocas palabras, el vocabulario es menos diverso; por el contrario, una cobertura más baja indica una mayor riqueza léxica.",
+    "hapax_intro": "Los hapax legomena (del griego «una sola vez») son palabras que aparecen exactamente una vez en el documento completo. Pueden indicar tanto riqueza léxica como errores tipográficos, nombres propios o términos especializados poco frecuentes.",
+    "hapax_data_intro": "Datos cuantitativos:",
+    "hapax_count_label": "Total de hapax",
+    "hapax_pct_unique_label": "Porcentaje del vocabulario único",
+    "hapax_pct_total_label": "Porcentaje del total de palabras",
+    "hapax_examples_note": "A continuación se muestran ejemplos de los hapax más largos y más cortos para ilustrar esta diversidad:",
+    "metadata_intro": "En este apartado se describen los criterios técnicos empleados para el análisis (idioma, tipo de n-grama, aplicación de lematización, exclusión de stopwords, sensibilidad a mayúsculas, etc.) y la fecha y hora exactas de generación del reporte (UTC). Esta información resulta útil para reproducir el estudio o ajustar la configuración en futuros análisis.",
+    "summary_tokens": "Tokens totales",
+    "summary_unique": "Tokens únicos",
+    "summary_top5": "Top 5 palabras",
+    "summary_concentration": "Top 5 palabras concentran",
+    "summary_comparison": "Comparación (lematizado)",
+    "lemmatized_unique_change": "variación de tokens únicos",
+    "scenario_title": "Ajustes de procesamiento",
+    "core_stats_title": "Estadísticas principales",
+    "token_extremes_title": "Análisis de longitud de palabras",
+    "core_including_hapax": "Incluyendo hapax",
+    "core_excluding_hapax": "Excluyendo hapax",
+    "core_hapax_only": "Solo hapax",
+    "top_words_title": "Palabras más frecuentes y su peso en el vocabulario",
+    "top_words_bigrams_title": "Top 5 palabras: bigramas frecuentes",
+    "top_words_examples_title": "Top 5 palabras: ejemplos en contexto",
+    "top_words_insights_title": "Top 5 palabras: bigramas y contexto",
+    "concentration_title": "Concentración del vocabulario",
+    "concentration_summary": "Las 5 palabras más frecuentes cubren el {top5} del texto; las 10 cubren el {top10}; y las 20 cubren el {top20}. (Calculado sobre {total} tokens sin lematizar).",
+    "concentration_intro_text": "A continuación, se muestra el porcentaje que ocupan las palabras más frecuentes respecto al total de tokens y respecto al vocabulario único:",
+    "concentration_top5": "Las 5 palabras más frecuentes: {pct_total} del total, {pct_unique} de únicos",
+    "concentration_top10": "Las 10 palabras más frecuentes: {pct_total} del total, {pct_unique} de únicos",
+    "concentration_top20": "Las 20 palabras más frecuentes: {pct_total} del total, {pct_unique} de únicos",
+    "hapax_title": "Hapax legomena (frecuencia = 1)",
+    "comparison_title": "Escenario de comparación",
+    "metric_header": "Métrica",
+    "current_header": "Actual",
+    "comparison_header": "Lematizado",
+    "length_header": "Longitud",
+    "not_lemmatized_header": "Sin lematizar",
+    "lemmatized_header": "Lematizado",
+    "stopwords_included": "incluidas",
+    "stopwords_excluded": "excluidas",
+    "showing_up_to_5": "mostrando hasta 5",
+    "hapax_summary_text": "Hapax legomena: {count} ({pct_unique} {of_unique}, {pct_total} {of_total}). Se incluyen hasta 5 ejemplos de los hapax más largos y más cortos.",
+    "hapax_longest_examples": "Hapax más largos (ejemplos)",
+    "hapax_shortest_examples": "Hapax más cortos (ejemplos)",
+    "word_header": "Palabra",
+    "count_header": "Conteo",
+    "bigrams_header": "Bigramas",
+    "examples_header": "Ejemplos",
+    "percent_label": "Porcentaje",
+    "concentration_chart_title": "Concentración del vocabulario",
+    "hapax_legomena_count": "Hapax (conteo)",
+    "hapax_legomena_pct_unique": "Hapax (% de únicos)",
+    "metadata_title": "Metadatos técnicos",
+    "metadata_scenario_header": "Procesamiento",
+    "metadata_cloud_header": "Nube de palabras",
+    "source_name": "Archivo",
+    "cloud_meta_title": "Parámetros de la nube (informativo)",
+    "token_stats_title": "Conteo de tokens por configuración",
+    "token_stats_header": "Configuración",
+    "token_stats_columns": "Total / Únicos",
+    "lemmatize_short": "Lematizar",
+    "yes": "sí",
+    "label": "Etiqueta",
+    "language": "Idioma",
+    "ngram": "N-grama",
+    "lemmatize": "Lematizar",
+    "include_stopwords": "Incluir stopwords",
+    "include_numbers": "Incluir números",
+    "case_sensitive": "Sensible a mayúsculas",
+    "exclude_words": "Excluir palabras",
+    "exclude_case_sensitive": "Exclusión sensible a mayúsculas",
+    "regex_rule": "Regla regex",
+    "regex_case_sensitive": "Regex sensible a mayúsculas",
+    "replace_stage": "Etapa de reemplazo",
+    "none": "Ninguno",
+    "no_data": "Sin datos disponibles.",
+    "not_available": "No disponible",
+    "warning": "Aviso",
+    "note": "Nota",
+    "no_examples_found": "No se encontraron ejemplos.",
+    "total_tokens": "Tokens totales",
+    "unique_tokens": "Tokens únicos",
+    "variability_ratio": "Ratio de variabilidad del vocabulario (unique/total)",
+    "variability_ratio_short": "Ratio de variabilidad (unique/total)",
+    "avg_token_length": "Longitud media de token",
+    "median_token_length": "Longitud mediana de token",
+    "avg_token_length_non_hapax": "Longitud media (excluyendo hapax)",
+    "median_token_length_non_hapax": "Longitud mediana (excluyendo hapax)",
+    "avg_token_length_hapax": "Longitud media (solo hapax)",
+    "median_token_length_hapax": "Longitud mediana (solo hapax)",
+    "avg_token_length_short": "Longitud media",
+    "median_token_length_short": "Longitud mediana",
+    "shortest_token": "Token más corto",
+    "longest_token": "Token más largo",
+    "shortest_non_hapax": "Token más corto (excluyendo hapax)",
+    "longest_non_hapax": "Token más largo (excluyendo hapax)",
+    "shortest_hapax": "Token más corto (solo hapax)",
+    "longest_hapax": "Token más largo (solo hapax)",
+    "of_unique": "de tokens únicos",
+    "of_total": "del total",
+    "top_5_concentration": "Las 5 palabras más frecuentes suman",
+    "top_10_concentration": "Las 10 palabras más frecuentes suman",
+    "top_20_concentration": "Las 20 palabras más frecuentes suman",
+    "of_all_tokens": "del total de tokens.",
+    "count": "Cantidad",
+    "sample_up_to_20": "Ejemplo (hasta 20)",
+    "longest_hapax_tokens": "Hapax más largo(s)",
+    "comparison_summary_title": "Resumen rápido vs escenario actual:",
+    "cloud_meta_na": "No aplica (análisis standalone).",
+    "max_words": "Máx. palabras",
+    "min_word_length": "Longitud mínima",
+    "canvas_size": "Tamaño del lienzo",
+    "theme": "Tema",
+    "background": "Fondo",
+    "font_color": "Color de fuente",
+    "relative_scaling": "Escalado relativo",
+    "prefer_horizontal": "Preferencia horizontal",
+    "mask": "Máscara",
+    "contour_width": "Ancho de contorno",
+    "contour_color": "Color de contorno",
+    "font_path": "Ruta de fuente",
+    "chars": "caracteres",
+    "showing_up_to_3": "mostrando hasta 3",
+    "glossary_title": "Glosario",
+    "glossary_token_def": "Unidad mínima de texto analizada. En este contexto, generalmente equivale a una palabra después del procesamiento (limpieza, exclusión de stopwords, etc.).",
+    "glossary_lemmatization_term": "Lematización",
+    "glossary_lemmatization_def": "Proceso de reducir cada palabra a su forma base o lema. Por ejemplo, 'corriendo', 'corrió' y 'correr' se agrupan bajo el lema 'correr'.",
+    "glossary_stopwords_def": "Palabras funcionales muy comunes (como 'el', 'la', 'de', 'y') que suelen excluirse del análisis porque no aportan información temática relevante.",
+    "glossary_hapax_def": "Palabras que aparecen una única vez en todo el texto. Su prevalencia indica la diversidad léxica del documento.",
+    "glossary_bigram_term": "Bigrama",
+    "glossary_bigram_def": "Par de palabras consecutivas en el texto. Por ejemplo, en 'cielo azul', el bigrama es ('cielo', 'azul').",
+    "glossary_variability_term": "Ratio de variabilidad",
+    "glossary_variability_def": "Proporción entre el número de palabras distintas (tipos) y el total de palabras (tokens). Un ratio alto indica mayor riqueza léxica.",
+}
+
+_ES_LABELS: Mapping[str, str] = MappingProxyType({**_EN_LABELS, **_ES_OVERLAY})
+
+
+def _get_report_labels(language: str) -> Mapping[str, str]:
+    return _ES_LABELS if (language or "")[:2].lower() == "es" else _EN_LABELS
+
+
+class _LazyExamples(Mapping):
+    """Top-term context examples, computed on first access and cached.
+
+    The text scan for all top-term bigrams runs once, on the first lookup,
+    so reports that never render the examples skip it. Terms without any
+    example are left out, as with a plain dict.
+    """
 
-    return {
-        "title": "Nubisary Report",
-        "generated_at": "Generated (UTC)",
-        "summary_title": "Summary",
-        "intro_text": "This report provides a detailed analysis of the vocabulary in the input text. It presents comparative metrics (with and without lemmatization), most frequent words, vocabulary concentration, hapax legomena (unique words), and technical metadata of the processing. The analyzed text comes from the file: {source_name}",
-        "summary_intro": "This section offers a comparative overview of the text's main metrics, both in its original form and after applying lemmatization (reducing each word to its base form). Calculations were performed excluding common functional words (stopwords). In short, the table shows how many words appear in total, how many are distinct, and how much lexical variability the document contains.",
-        "token_extremes_intro": "The shortest and longest token lengths detected in the corpus are indicated, distinguishing between words that appear only once (hapax) and those that are repeated. This breakdown allows for quick identification of infrequent or specialized terms.",
-        "top_words_intro": "Here are the twenty words with the highest number of occurrences before lemmatization, accompanied by the exact count and the percentage they represent of the total tokens. This information reveals the central thematic concepts of the text. At the end of the table, the cumulative coverage of the top 5, 10, and 20 most common terms is shown, indicating the lexical concentration of the document.",
-        "top_words_insights_intro": "For each of the five most frequent words, examples of bigrams (consecutive word pairs) and context fragments where they appear are presented. This shows how these words are used within real sentences and their relationship with other concepts in the text.",
-        "concentration_intro": "This table indicates the proportion of total words that is composed of the 5, 10, and 20 most common terms. When a large part of the text is formed by a few words, the vocabulary is less diverse; conversely, lower coverage indicates greater lexical richness.",
-        "hapax_intro": "Hapax legomena (from Greek «only once») are words that appear exactly once in the complete document. They can indicate both lexical richness and typographical errors, proper names, or infrequent specialized terms.",
-        "hapax_data_intro": "Quantitative data:",
-        "hapax_count_label": "Total hapax",
-        "hapax_pct_unique_label": "Percentage of unique vocabulary",
-        "hapax_pct_total_label": "Percentage of total words",
-        "hapax_examples_note": "Below are examples of the longest and shortest hapax to illustrate this diversity:",
-        "metadata_intro": "This section describes the technical criteria used for the analysis (language, n-gram type, lemmatization application, stopwords exclusion, case sensitivity, etc.) and the exact date and time of report generation (UTC). This information is useful for reproducing the study or adjusting the configuration in future analyses.",
-        "summary_tokens": "Total tokens",
-        "summary_unique": "Unique tokens",
-        "summary_hapax": "Hapax legomena",
-        "summary_top5": "Top 5 words",
-        "summary_concentration": "Top 5 words concentration",
-        "summary_comparison": "Comparison (lemmatized)",
-        "lemmatized_unique_change": "unique tokens change",
-        "scenario_title": "Processing Settings",
-        "core_stats_title": "Core Statistics",
-        "token_extremes_title": "Word Length Analysis",
-        "core_including_hapax": "Including hapax",
-        "core_excluding_hapax": "Excluding hapax",
-        "core_hapax_only": "Hapax only",
-        "top_words_title": "Most Frequent Words and Their Weight in the Vocabulary",
-        "top_words_bigrams_title": "Top 5 Words: Common Bigrams",
-        "top_words_examples_title": "Top 5 Words: Context Examples",
-        "top_words_insights_title": "Top 5 Words: Bigrams & Context",
-        "concentration_title": "Vocabulary Concentration",
-        "concentration_summary": "The top 5 most frequent words cover {top5} of the text; the top 10 cover {top10}; and the top 20 cover {top20}. (Calculated over {total} tokens without lemmatization).",
-        "concentration_intro_text": "The following percentages show the coverage of the most frequent words relative to total tokens and unique vocabulary:",
-        "concentration_top5": "The top 5 most frequent words: {pct_total} of total, {pct_unique} of unique",
-        "concentration_top10": "The top 10 most frequent words: {pct_total} of total, {pct_unique} of unique",
-        "concentration_top20": "The top 20 most frequent words: {pct_total} of total, {pct_unique} of unique",
-        "percent_header": "% of total",
-        "of_unique": "of unique",
-        "hapax_title": "Hapax Legomena (frequency = 1)",
-        "comparison_title": "Comparison Scenario",
-        "metric_header": "Metric",
-        "current_header": "Current",
-        "comparison_header": "Lemmatized",
-        "length_header": "Length",
-        "not_lemmatized_header": "Not lemmatized",
-        "lemmatized_header": "Lemmatized",
-        "stopwords_included": "included",
-        "stopwords_excluded": "excluded",
-        "showing_up_to_5": "showing up to 5",
-        "hapax_summary_text": "Hapax legomena: {count} ({pct_unique} {of_unique}, {pct_total} {of_total}). Up to 5 examples of the longest and shortest hapax are included.",
-        "hapax_longest_examples": "Longest hapax (examples)",
-        "hapax_shortest_examples": "Shortest hapax (examples)",
-        "word_header": "Word",
-        "count_header": "Count",
-        "percent_header": "%",
-        "bigrams_header": "Bigrams",
-        "examples_header": "Examples",
-        "top5_short": "Top 5",
-        "top10_short": "Top 10",
-        "top20_short": "Top 20",
-        "percent_label": "Percent",
-        "concentration_chart_title": "Vocabulary Concentration",
-        "top_5_concentration_short": "Top 5",
-        "top_10_concentration_short": "Top 10",
-        "top_20_concentration_short": "Top 20",
-        "hapax_legomena_count": "Hapax (count)",
-        "hapax_legomena_pct_unique": "Hapax (% of unique)",
-        "metadata_title": "Technical Metadata",
-        "metadata_scenario_header": "Processing",
-        "metadata_cloud_header": "Word Cloud",
-        "source_name": "Source file",
-        "cloud_meta_title": "Word Cloud Settings (informational)",
-        "token_stats_title": "Token counts by configuration",
-        "token_stats_header": "Configuration",
-        "token_stats_columns": "Total / Unique",
-        "lemmatize_short": "Lemmatize",
-        "stopwords_short": "Stopwords",
-        "yes": "yes",
-        "no": "no",
-        "label": "Label",
-        "language": "Language",
-        "ngram": "N-gram",
-        "lemmatize": "Lemmatize",
-        "include_stopwords": "Include stopwords",
-        "include_numbers": "Include numbers",
-        "case_sensitive": "Case sensitive",
-        "exclude_words": "Exclude words",
-        "exclude_case_sensitive": "Exclude case sensitive",
-        "regex_rule": "Regex rule",
-        "regex_case_sensitive": "Regex case sensitive",
-        "replace_stage": "Replace stage",
-        "none": "None",
-        "na": "N/A",
-        "no_data": "No data available.",
-        "not_available": "Not available",
-        "warning": "Warning",
-        "note": "Note",
-        "no_examples_found": "No examples found.",
-        "total_tokens": "Total tokens",
-        "unique_tokens": "Unique tokens",
-        "variability_ratio": "Vocabulary variability ratio (unique/total)",
-        "variability_ratio_short": "Vocabulary variability ratio",
-        "hapax_legomena": "Hapax legomena",
-        "avg_token_length": "Average token length",
-        "median_token_length": "Median token length",
-        "avg_token_length_non_hapax": "Average token length (excluding hapax)",
-        "median_token_length_non_hapax": "Median token length (excluding hapax)",
-        "avg_token_length_hapax": "Average token length (hapax only)",
-        "median_token_length_hapax": "Median token length (hapax only)",
-        "avg_token_length_short": "Average token length",
-        "median_token_length_short": "Median token length",
-        "shortest_token": "Shortest token",
-        "longest_token": "Longest token",
-        "shortest_non_hapax": "Shortest token (excluding hapax)",
-        "longest_non_hapax": "Longest token (excluding hapax)",
-        "shortest_hapax": "Shortest token (hapax only)",
-        "longest_hapax": "Longest token (hapax only)",
-        "of_unique": "of unique tokens",
-        "of_total": "of total",
-        "top_5_concentration": "Top 5 words account for",
-        "top_10_concentration": "Top 10 words account for",
-        "top_20_concentration": "Top 20 words account for",
-        "of_all_tokens": "of all tokens.",
-        "count": "Count",
-        "sample_up_to_20": "Sample (up to 20)",
-        "longest_hapax_tokens": "Longest hapax token(s)",
-        "comparison_summary_title": "Quick comparison vs current scenario:",
-        "cloud_meta_na": "Not applicable (standalone analysis).",
-        "max_words": "Max words",
-        "min_word_length": "Min word length",
-        "canvas_size": "Canvas size",
-        "theme": "Theme",
-        "colormap": "Colormap",
-        "background": "Background",
-        "font_color": "Font color",
-        "relative_scaling": "Relative scaling",
-        "prefer_horizontal": "Prefer horizontal",
-        "mask": "Mask",
-        "contour_width": "Contour width",
-        "contour_color": "Contour color",
-        "font_path": "Font path",
-        "chars": "chars",
-        "showing_up_to_3": "showing up to 3",
-        "glossary_title": "Glossary",
-        "glossary_token_term": "Token",
-        "glossary_token_def": "Minimum unit of text analyzed. In this context, it generally corresponds to a word after processing (cleaning, stopwords exclusion, etc.).",
-        "glossary_lemmatization_term": "Lemmatization",
-        "glossary_lemmatization_def": "Process of reducing each word to its base or dictionary form (lemma). For example, 'running', 'ran', and 'run' are grouped under the lemma 'run'.",
-        "glossary_stopwords_term": "Stopwords",
-        "glossary_stopwords_def": "Very common functional words (such as 'the', 'a', 'of', 'and') that are usually excluded from analysis because they do not provide relevant thematic information.",
-        "glossary_hapax_term": "Hapax legomena",
-        "glossary_hapax_def": "Words that appear only once in the entire text. Their prevalence indicates the lexical diversity of the document.",
-        "glossary_bigram_term": "Bigram",
-        "glossary_bigram_def": "Pair of consecutive words in the text. For example, in 'blue sky', the bigram is ('blue', 'sky').",
-        "glossary_variability_term": "Variability ratio",
-        "glossary_variability_def": "Proportion between the number of distinct words (types) and the total number of words (tokens). A high ratio indicates greater lexical richness.",
-    }
+    def __init__(
+        self,
+        raw_text: str,
+        term_pairs: Dict[str, List[Optional[Tuple[str, str]]]],
+        case_sensitive: bool,
+        language: str,
+        examples_per_word: int,
+    ) -> None:
+        self._raw_text = raw_text
+        self._term_pairs = term_pairs
+        self._case_sensitive = case_sensitive
+        self._language = language
+        self._examples_per_word = examples_per_word
+        self._candidates: Optional[Dict[Tuple[str, str], List[Tuple[int, str]]]] = None
+        self._cache: Dict[str, List[str]] = {}
+
+    def _bigram_candidates(self) -> Dict[Tuple[str, str], List[Tuple[int, str]]]:
+        if self._candidates is None:
+            all_pairs = [pair for pairs in self._term_pairs.values() for pair in pairs if pair]
+            self._candidates = {}
+            if all_pairs:
+                # Scan the text once for the bigrams of all top terms
+                self._candidates = _collect_bigram_candidates(
+                    self._raw_text,
+                    all_pairs,
+                    case_sensitive=self._case_sensitive,
+                    language=self._language,
+                    context_words=1,  # 1 word before and after
+                )
+        return self._candidates
+
+    def _examples_for(self, term: str) -> List[str]:
+        if term in self._cache:
+            return self._cache[term]
+        # We want 1 example per bigram (up to examples_per_word in total),
+        # falling back to the next bigram whenever one yields no example
+        candidates = self._bigram_candidates()
+        term_examples: List[str] = []
+        needed = self._examples_per_word
+        for pair in self._term_pairs[term]:
+            if needed <= 0:
+                break
+            bigram_examples = _purest_examples(
+                candidates.get(pair, []),
+                max_examples=1,  # 1 example per bigram (the "purest" one)
+            )
+            if bigram_examples:
+                term_examples.append(bigram_examples[0])
+                needed -= 1
+        self._cache[term] = term_examples
+        return term_examples
+
+    def __getitem__(self, term: str) -> List[str]:
+        if term in self._term_pairs:
+            examples = self._examples_for(term)
+            if examples:
+                return examples
+        raise KeyError(term)
+
+    def __iter__(self) -> Iterator[str]:
+        return (term for term in self._term_pairs if self._examples_for(term))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
 
-def _chunk_list(values: List[str], size: int) -> List[List[str]]:
+
+def _chunk_list(values: Iterable[str], size: int) -> Iterator[List[str]]:
     if size <= 0:
-        return [values]
-    return [values[i:i + size] for i in range(0, len(values), size)]
+        return iter([list(values)])
+    iterator = iter(values)
+    return iter(lambda: list(islice(iterator, size)), [])
 
 
 def _build_top_word_insights(
@@ -1784,60 +1884,42 @@ def _build_top_word_insights(
     context_window: int,
     top_terms_override: Optional[List[str]],
     top_terms_note: Optional[str],
-) -> Dict[str, object]:
+) -> TopWordInsights:
     top_terms = top_terms_override
     if not top_terms:
-        top_words = sorted(frequencies.items(), key=lambda item: (-item[1], item[0]))[:top_word_count]
+        top_words = heapq.nsmallest(top_word_count, frequencies.items(), key=lambda item: (-item[1], item[0]))
         top_terms = [word for word, _ in top_words]
 
-    bigrams_info: Dict[str, object] = {"available": False, "reason": "N/A", "items": {}, "note": top_terms_note}
+    bigrams_info = InsightSection(note=top_terms_note)
     bigrams_items = {}
     if bigram_frequencies:
-        bigrams_info["available"] = True
-        bigrams_info["reason"] = ""
+        bigrams_info.available = True
+        bigrams_info.reason = ""
         bigrams_items = _top_word_bigrams(top_terms, bigram_frequencies)
-        bigrams_info["items"] = bigrams_items
+        bigrams_info.items = bigrams_items
     else:
-        bigrams_info["reason"] = "Bigram data not available for this input."
+        bigrams_info.reason = "Bigram data not available for this input."
 
-    examples_info: Dict[str, object] = {"available": False, "reason": "N/A", "items": {}, "note": top_terms_note}
+    examples_info = InsightSection(note=top_terms_note)
     if raw_text:
-        examples_info["available"] = True
-        examples_info["reason"] = ""
-        examples_info["items"] = {}
-        for term in top_terms:
-            # Extract examples for the bigrams of this term
-            # We want 1 example per bigram (up to 5 examples total)
-            term_bigrams = bigrams_items.get(term, [])
-            term_examples = []
-            
-            # Try to get examples for top bigrams, with fallback
-            bigram_index = 0
-            while len(term_examples) < examples_per_word and bigram_index < len(term_bigrams):
-                bigram_item = term_bigrams[bigram_index]
-                bigram = bigram_item["bigram"]
-                bigram_examples = _extract_bigram_context_examples(
-                    raw_text,
-                    bigram,
-                    case_sensitive=case_sensitive,
-                    language=language,
-                    max_examples=1,  # 1 example per bigram (the "purest" one)
-                    context_words=1,  # 1 word before and after
-                )
-                if bigram_examples:
-                    term_examples.extend(bigram_examples)
-                # Move to next bigram (whether we found an example or not)
-                bigram_index += 1
-            
-            examples_info["items"][term] = term_examples
+        examples_info.available = True
+        examples_info.reason = ""
+        # Parse each top-term bigram into a (word1, word2) pair once
+        term_pairs = {
+            term: [_bigram_pair(item["bigram"]) for item in bigrams_items.get(term, [])]
+            for term in top_terms
+        }
+        examples_info.items = _LazyExamples(
+            raw_text,
+            term_pairs,
+            case_sensitive=case_sensitive,
+            language=language,
+            examples_per_word=examples_per_word,
+        )
     else:
-        examples_info["reason"] = "Original text not available for this input."
+        examples_info.reason = "Original text not available for this input."
 
-    return {
-        "top_terms": top_terms,
-        "bigrams": bigrams_info,
-        "examples": examples_info,
-    }
+    return TopWordInsights(top_terms=top_terms, bigrams=bigrams_info, examples=examples_info)
 
 
 def _top_word_bigrams(
@@ -1849,19 +1931,35 @@ def _top_word_bigrams(
     if not top_terms:
         return results
 
+    # Index bigrams by their component words in a single pass, so each term
+    # is a dict lookup instead of a full scan of bigram_frequencies. Only
+    # words that are top terms are indexed.
+    top_set = frozenset(top_terms)
+    index: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
+    for bigram, count in bigram_frequencies.items():
+        parts = bigram.split()
+        if len(parts) != 2:
+            continue
+        first, second = parts
+        if first in top_set:
+            index[first].append((bigram, count))
+        if second != first and second in top_set:
+            index[second].append((bigram, count))
+
     for term in top_terms:
-        matches = []
-        for bigram, count in bigram_frequencies.items():
-            parts = bigram.split()
-            if len(parts) != 2:
-                continue
-            if parts[0] == term or parts[1] == term:
-                matches.append({"bigram": bigram, "count": count})
-        matches.sort(key=lambda item: (-item["count"], item["bigram"]))
-        results[term] = matches[:max_bigrams]
+        matches = heapq.nsmallest(max_bigrams, index.get(term, []), key=lambda item: (-item[1], item[0]))
+        results[term] = [{"bigram": bigram, "count": count} for bigram, count in matches]
     return results
 
 
+def _bigram_pair(bigram: str) -> Optional[Tuple[str, str]]:
+    """Parse a "word1 word2" bigram key into a (word1, word2) pair."""
+    parts = bigram.split() if bigram else []
+    if len(parts) != 2:
+        return None
+    return parts[0], parts[1]
+
+
 def _extract_context_examples(
     raw_text: str,
     term: str,
@@ -1917,119 +2015,212 @@ def _extract_bigram_context_examples(
     6. Convert to lowercase if the entire example is uppercase
     7. Prefer "purer" matches (fewer words between word1 and word2)
     """
-    if not bigram:
+    pair = _bigram_pair(bigram)
+    if pair is None:
         return []
+    candidates = _collect_bigram_candidates(
+        raw_text,
+        [pair],
+        case_sensitive=case_sensitive,
+        language=language,
+        context_words=context_words,
+    )
+    return _purest_examples(candidates.get(pair, []), max_examples)
 
-    bigram_parts = bigram.split()
-    if len(bigram_parts) != 2:
-        return []
 
-    word1, word2 = bigram_parts
-    
+def _collect_bigram_candidates(
+    raw_text: str,
+    bigrams: Iterable[Tuple[str, str]],
+    case_sensitive: bool,
+    language: str,
+    context_words: int,
+) -> Dict[Tuple[str, str], List[Tuple[int, str]]]:
+    """
+    Scan raw_text once and collect (distance, context) candidates for every
+    (word1, word2) bigram pair.
+
+    Candidates are listed window by window, in text order within each 3-line
+    window; see _extract_bigram_context_examples for the matching rules.
+    """
+    candidates: Dict[Tuple[str, str], List[Tuple[int, str]]] = {}
+    if not raw_text:
+        return candidates
+
+    tokens, tokens_cmp, line_ids, segment_ids, positions = _document_tokens(raw_text, case_sensitive)
+
+    # Group the bigrams by their first word, dropping any bigram whose words
+    # are not tokens of the text
+    targets: Dict[str, List[Tuple[str, Tuple[str, str]]]] = defaultdict(list)
+    for bigram in bigrams:
+        if bigram in candidates:
+            continue
+        word1, word2 = bigram
+        word1_cmp = word1 if case_sensitive else word1.lower()
+        word2_cmp = word2 if case_sensitive else word2.lower()
+        candidates[bigram] = []
+        if word1_cmp not in positions or word2_cmp not in positions:
+            continue
+        targets[word1_cmp].append((word2_cmp, bigram))
+    if not targets:
+        return candidates
+
     # Get stopwords for this language
+    stopword_set = _stopword_set(language)
+
+    # A bigram may span up to 3 consecutive lines but never a sentence
+    # delimiter. Each match is reported once per 3-line window holding it,
+    # with its context clipped to that window, and candidates are listed
+    # window by window, in text order within each window.
+    found: Dict[Tuple[str, str], List[Tuple[int, int, int, str]]] = defaultdict(list)
+    for word1_cmp, matches in targets.items():
+        # Visit only the positions where a first word occurs
+        for i in positions.get(word1_cmp, ()):
+            segment = segment_ids[i]
+            segment_start = bisect_left(segment_ids, segment, 0, i)
+            segment_end = bisect_right(segment_ids, segment, i)
+            for word2_cmp, bigram in matches:
+                # Look for word2 in the next 5 positions (0-4 words between)
+                j = _first_bigram_end(tokens_cmp, i, min(i + 6, segment_end), word2_cmp, stopword_set)
+                if j is None:
+                    continue
+                # Calculate distance (number of words between word1 and word2)
+                distance = j - i - 1
+                for window in range(max(0, line_ids[j] - 2), line_ids[i] + 1):
+                    # The part of this sentence that falls inside the window
+                    part_start = bisect_left(line_ids, window, segment_start, segment_end)
+                    part_end = bisect_right(line_ids, window + 2, segment_start, segment_end)
+                    context = _bigram_context(tokens, i, j, part_start, part_end, context_words)
+                    found[bigram].append((window, i, distance, context))
+
+    for bigram, entries in found.items():
+        entries.sort(key=itemgetter(0, 1))
+        candidates[bigram] = [(distance, context) for _, _, distance, context in entries]
+
+    return candidates
+
+
+def _document_tokens(
+    raw_text: str,
+    case_sensitive: bool,
+) -> Tuple[List[str], List[str], List[int], List[int], Dict[str, List[int]]]:
+    """
+    Tokenize raw_text once, returning the tokens, their comparable forms,
+    per token its line number and sentence segment number, and the positions
+    of every comparable token.
+
+    Lines are those of str.splitlines(). A new segment starts after every
+    sentence delimiter (. ; ? !), so a segment may run across line breaks.
+    """
+    tokens: List[str] = []
+    line_ids: List[int] = []
+    segment_ids: List[int] = []
+    segment = 0
+    for line_id, line in enumerate(_iter_lines(raw_text)):
+        for index, sentence_part in enumerate(_SENTENCE_SPLIT_PATTERN.split(line)):
+            if index:
+                segment += 1
+            part_tokens = _tokenize_words(sentence_part)
+            tokens.extend(part_tokens)
+            line_ids.extend([line_id] * len(part_tokens))
+            segment_ids.extend([segment] * len(part_tokens))
+    tokens_cmp = tokens if case_sensitive else [t.lower() for t in tokens]
+    positions: Dict[str, List[int]] = defaultdict(list)
+    for i, token in enumerate(tokens_cmp):
+        positions[token].append(i)
+    return tokens, tokens_cmp, line_ids, segment_ids, dict(positions)
+
+
+def _first_bigram_end(
+    tokens_cmp: List[str],
+    i: int,
+    stop: int,
+    word2_cmp: str,
+    stopword_set: frozenset,
+) -> Optional[int]:
+    """Index of the first word2 before stop that forms a bigram with tokens_cmp[i] once stopwords are dropped."""
+    # Removing stopwords must leave exactly (word1, word2), so neither word
+    # may be a stopword and every word in between must be one
+    if tokens_cmp[i] in stopword_set or word2_cmp in stopword_set:
+        return None
+    for j in range(i + 1, stop):
+        token = tokens_cmp[j]
+        if token == word2_cmp:
+            return j
+        if token not in stopword_set:
+            return None
+    return None
+
+
+def _bigram_context(
+    tokens: List[str],
+    i: int,
+    j: int,
+    part_start: int,
+    part_end: int,
+    context_words: int,
+) -> str:
+    """Context for the bigram tokens[i]..tokens[j]: N words before, the match, N words after."""
+    start = max(part_start, i - context_words)
+    end = min(part_end, j + context_words + 1)
+
+    # Check if context is truncated
+    prefix = "(...) " if start > part_start else ""
+    suffix = " (...)" if end < part_end else ""
+
+    context = " ".join(tokens[start:end])
+
+    # Convert to lowercase if entire context is uppercase. Contexts are built
+    # from the original tokens, so this applies even when matching ignores
+    # case; isupper() already stops at the first lowercase character.
+    if context.isupper():
+        context = context.lower()
+
+    return prefix + context + suffix
+
+
+def _purest_examples(candidates: List[Tuple[int, str]], max_examples: int) -> List[str]:
+    # Prefer purer matches (fewer words in between), then earlier ones, and
+    # list each context once, under its purest occurrence
+    limit = max(max_examples, 1)
+    best: Dict[str, Tuple[int, int]] = {}
+    adjacent = 0
+    for index, (distance, context) in enumerate(candidates):
+        previous = best.get(context)
+        if previous is not None and previous[0] <= distance:
+            continue
+        best[context] = (distance, index)
+        if distance == 0:
+            adjacent += 1
+            # Later candidates can no longer beat these adjacent matches
+            if adjacent >= limit:
+                break
+
+    return [context for context, _ in heapq.nsmallest(limit, best.items(), key=itemgetter(1))]
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Lazily yield the same lines as text.splitlines() without building the list."""
+    start = 0
+    for match in _LINE_BREAK_PATTERN.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    if start < len(text):
+        yield text[start:]
+
+
+@lru_cache(maxsize=32)
+def _stopword_set(language: str) -> frozenset:
     try:
-        stopword_set = set(stopwords.words(language))
+        return frozenset(stopwords.words(language))
     except Exception:
         # If language not supported, use empty set
-        stopword_set = set()
-    
-    word1_cmp = word1 if case_sensitive else word1.lower()
-    word2_cmp = word2 if case_sensitive else word2.lower()
-    
-    # Split text into lines
-    lines = raw_text.splitlines()
-    
-    candidates = []  # List of (distance, context) tuples for sorting by purity
-    
-    # Process lines, allowing bigrams to span across consecutive lines
-    for line_idx in range(len(lines)):
-        # Get current line and potentially next line(s)
-        current_lines = [lines[line_idx]]
-        
-        # Look ahead up to 2 more lines for word2 (if word1 is at the end of current line)
-        for next_offset in range(1, min(3, len(lines) - line_idx)):
-            current_lines.append(lines[line_idx + next_offset])
-        
-        # Join with newline preserved temporarily as a marker
-        combined = "\n".join(current_lines)
-        
-        # Check if there are sentence delimiters that would invalidate the bigram
-        # Split by sentence delimiters
-        sentence_parts = re.split(r'[.;?!]', combined)
-        
-        for sentence_part in sentence_parts:
-            if not sentence_part.strip():
-                continue
-            
-            # Now we can work with this part, replacing \n with space for tokenization
-            sentence_normalized = sentence_part.replace("\n", " ")
-            
-            tokens = _tokenize_words(sentence_normalized)
-            if len(tokens) < 2:
-                continue
-            
-            tokens_cmp = tokens if case_sensitive else [t.lower() for t in tokens]
-            
-            # Search for word1 followed by word2 (with max 4 words in between)
-            for i in range(len(tokens_cmp)):
-                if tokens_cmp[i] != word1_cmp:
-                    continue
-                
-                # Look for word2 in the next 5 positions (0-4 words between)
-                for j in range(i + 1, min(i + 6, len(tokens_cmp) + 1)):
-                    if j >= len(tokens_cmp):
-                        break
-                    if tokens_cmp[j] != word2_cmp:
-                        continue
-                    
-                    # Found a match! Now validate by removing stopwords
-                    words_between = tokens_cmp[i:j+1]
-                    # Remove stopwords from the segment
-                    filtered = [w for w in words_between if w not in stopword_set]
-                    
-                    # Check if after removing stopwords we have our bigram
-                    if len(filtered) == 2 and filtered[0] == word1_cmp and filtered[1] == word2_cmp:
-                        # Valid bigram! Extract context: N words before, the match, N words after
-                        start = max(0, i - context_words)
-                        end = min(len(tokens), j + context_words + 1)
-                        
-                        # Check if context is truncated
-                        prefix = "(...) " if start > 0 else ""
-                        suffix = " (...)" if end < len(tokens) else ""
-                        
-                        context_tokens = tokens[start:end]
-                        context = " ".join(context_tokens)
-                        
-                        # Convert to lowercase if entire context is uppercase
-                        if context.isupper():
-                            context = context.lower()
-                        
-                        context = prefix + context + suffix
-                        
-                        # Calculate distance (number of words between word1 and word2)
-                        distance = j - i - 1
-                        
-                        if context:
-                            candidates.append((distance, context))
-                        break  # Found word2, move to next word1
-    
-    # Sort by distance (prefer purer matches with fewer words in between)
-    # Then remove duplicates while preserving order
-    candidates.sort(key=lambda x: x[0])
-    seen = set()
-    examples = []
-    for _, context in candidates:
-        if context not in seen:
-            seen.add(context)
-            examples.append(context)
-            if len(examples) >= max_examples:
-                break
-    
-    return examples
+        return frozenset()
 
 
 def _tokenize_words(text: str) -> List[str]:
-    return re.findall(r"\b\w+\b", text, flags=re.UNICODE)
+    # str.isascii() is a constant-time flag check
+    pattern = _ASCII_WORD_PATTERN if text.isascii() else _WORD_PATTERN
+    return pattern.findall(text)
 
 
 def _is_context_useful(context: str, term: str, case_sensitive: bool) -> bool:
@@ -2046,5 +2237,5 @@ def _is_context_useful(context: str, term: str, case_sensitive: bool) -> bool:
 
 
 def _utc_timestamp() -> str:
-    return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
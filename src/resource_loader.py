@@ -7,7 +7,18 @@ both in development mode and when bundled as a PyInstaller executable.
 import os
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+
+# PyInstaller extracts bundled files to a temp folder stored in _MEIPASS;
+# otherwise resources live in the project root (this file is in src/).
+# Neither changes while the process runs, so resolve it once.
+_BASE_PATH = getattr(sys, '_MEIPASS', None) or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# list_mask_files results by (masks_dir, without_extension), each stored with
+# the directory mtime it was read at so added or removed masks show up
+_MASK_CACHE: Dict[Tuple[str, bool], Tuple[int, Tuple[str, ...]]] = {}
 
 
 def get_resource_path(relative_path: str) -> str:
@@ -25,16 +36,7 @@ def get_resource_path(relative_path: str) -> str:
     Example:
         >>> mask_path = get_resource_path('samples/masks/heart.png')
     """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        # This is the base path where PyInstaller extracts bundled files
-        base_path = sys._MEIPASS
-    except AttributeError:
-        # Not running as PyInstaller bundle, use current script directory
-        # Get the project root (assuming this file is in src/)
-        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
 
 
 def list_mask_files(without_extension: bool = False) -> List[str]:
@@ -58,31 +60,42 @@ def list_mask_files(without_extension: bool = False) -> List[str]:
     """
     masks_dir = get_resource_path('samples/masks')
     
-    if not os.path.exists(masks_dir):
+    try:
+        mtime_ns = os.stat(masks_dir).st_mtime_ns
+    except OSError:
+        # Masks directory doesn't exist
         return []
     
+    cache_key = (masks_dir, without_extension)
+    cached = _MASK_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns:
+        return list(cached[1])
+    
     # Supported image extensions
     image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp'}
     
     mask_files = []
     try:
-        for filename in os.listdir(masks_dir):
-            file_path = os.path.join(masks_dir, filename)
-            # Only include files (not directories) with image extensions
-            if os.path.isfile(file_path):
-                file_ext = os.path.splitext(filename)[1].lower()
-                if file_ext in image_extensions:
-                    if without_extension:
-                        # Return name without extension
-                        mask_files.append(os.path.splitext(filename)[0])
-                    else:
-                        # Return full filename
-                        mask_files.append(filename)
+        # scandir reports the entry type, so files need no extra stat call
+        with os.scandir(masks_dir) as entries:
+            for entry in entries:
+                # Only include files (not directories) with image extensions
+                if entry.is_file():
+                    name, file_ext = os.path.splitext(entry.name)
+                    if file_ext.lower() in image_extensions:
+                        if without_extension:
+                            # Return name without extension
+                            mask_files.append(name)
+                        else:
+                            # Return full filename
+                            mask_files.append(entry.name)
     except (OSError, PermissionError):
         # Directory exists but can't be read
         return []
     
-    return sorted(mask_files)
+    mask_files.sort()
+    _MASK_CACHE[cache_key] = (mtime_ns, tuple(mask_files))
+    return mask_files
 
 
 def get_mask_path(mask_filename: str) -> Optional[str]:
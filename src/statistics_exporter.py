@@ -2,7 +2,9 @@
 
 import json
 import csv
-from typing import Dict, Optional, Tuple
+import heapq
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple, Union
 import os
 
 from src.logger import setup_logger
@@ -24,14 +26,32 @@ def get_top_words(frequencies: Dict[str, float], n: int) -> Dict[str, float]:
     if n is None or n <= 0:
         return frequencies
     
-    # Sort by frequency (descending) and take top N
-    sorted_words = sorted(frequencies.items(), key=lambda x: x[1], reverse=True)
-    return dict(sorted_words[:n])
+    return dict(_sorted_items(frequencies, n))
+
+
+def _sorted_items(frequencies: Dict[str, float], n: Optional[int] = None) -> List[Tuple[str, float]]:
+    """
+    Get (word, frequency) pairs sorted by frequency (descending).
+    
+    When n is positive only the top N pairs are selected, with a bounded heap
+    instead of a full sort. Ties keep their insertion order either way.
+    """
+    if n is None or n <= 0:
+        return sorted(frequencies.items(), key=itemgetter(1), reverse=True)
+    return heapq.nlargest(n, frequencies.items(), key=itemgetter(1))
+
+
+def _with_extension(output_file: Union[str, os.PathLike], extension: str) -> str:
+    """Return output_file as a string, appending extension unless it already has it."""
+    output_file = os.fspath(output_file)
+    if not output_file.lower().endswith(extension):
+        output_file = output_file + extension
+    return output_file
 
 
 def export_statistics_json(
     frequencies: Dict[str, float],
-    output_file: str,
+    output_file: Union[str, os.PathLike],
     top_n: Optional[int] = None
 ) -> str:
     """
@@ -45,25 +65,23 @@ def export_statistics_json(
     Returns:
         Path to the created JSON file
     """
-    # Get frequencies to export (all or top N)
+    # Get frequencies to export (all or top N), sorted by frequency
+    # (descending) for better readability; json keeps the dict order
     if top_n is not None:
-        data_to_export = get_top_words(frequencies, top_n)
         logger.info(f'Exporting top {top_n} words to JSON')
     else:
-        data_to_export = frequencies
         logger.info(f'Exporting all {len(frequencies)} words to JSON')
-    
-    # Sort by frequency (descending) for better readability
-    sorted_data = dict(sorted(data_to_export.items(), key=lambda x: x[1], reverse=True))
+    sorted_data = dict(_sorted_items(frequencies, top_n))
     
     # Ensure .json extension
-    if not output_file.endswith('.json'):
-        output_file = output_file + '.json'
+    output_file = _with_extension(output_file, '.json')
     
     # Write JSON file
     try:
+        # Encode the whole document at once and write it with a single call
+        payload = json.dumps(sorted_data, indent=2, ensure_ascii=False)
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(sorted_data, f, indent=2, ensure_ascii=False)
+            f.write(payload)
         logger.info(f'Statistics exported to {output_file}')
         return output_file
     except Exception as e:
@@ -73,7 +91,7 @@ def export_statistics_json(
 
 def export_statistics_csv(
     frequencies: Dict[str, float],
-    output_file: str,
+    output_file: Union[str, os.PathLike],
     top_n: Optional[int] = None
 ) -> str:
     """
@@ -87,20 +105,15 @@ def export_statistics_csv(
     Returns:
         Path to the created CSV file
     """
-    # Get frequencies to export (all or top N)
+    # Get frequencies to export (all or top N), sorted by frequency (descending)
     if top_n is not None:
-        data_to_export = get_top_words(frequencies, top_n)
         logger.info(f'Exporting top {top_n} words to CSV')
     else:
-        data_to_export = frequencies
         logger.info(f'Exporting all {len(frequencies)} words to CSV')
-    
-    # Sort by frequency (descending)
-    sorted_data = sorted(data_to_export.items(), key=lambda x: x[1], reverse=True)
+    sorted_data = _sorted_items(frequencies, top_n)
     
     # Ensure .csv extension
-    if not output_file.endswith('.csv'):
-        output_file = output_file + '.csv'
+    output_file = _with_extension(output_file, '.csv')
     
     # Write CSV file
     try:
@@ -109,8 +122,7 @@ def export_statistics_csv(
             # Write header
             writer.writerow(['word', 'frequency'])
             # Write data
-            for word, frequency in sorted_data:
-                writer.writerow([word, frequency])
+            writer.writerows(sorted_data)
         logger.info(f'Statistics exported to {output_file}')
         return output_file
     except Exception as e:
@@ -120,7 +132,7 @@ def export_statistics_csv(
 
 def export_statistics(
     frequencies: Dict[str, float],
-    base_output_file: str,
+    base_output_file: Union[str, os.PathLike],
     top_n: Optional[int] = None
 ) -> Tuple[str, str]:
     """
@@ -135,7 +147,7 @@ def export_statistics(
         Tuple of (json_file_path, csv_file_path)
     """
     # Ensure base name doesn't have extensions
-    base_name = os.path.splitext(base_output_file)[0]
+    base_name = os.path.splitext(os.fspath(base_output_file))[0]
     json_file = base_name + '_vocabulary.json'
     csv_file = base_name + '_vocabulary.csv'
     
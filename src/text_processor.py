@@ -2,9 +2,11 @@
 
 import re
 import os
+import string
 from collections import Counter
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from nltk.corpus import stopwords
 
 try:
@@ -16,43 +18,134 @@ except ImportError:
 from src.config import PUNCTUATION
 
 
-def normalize_single_word(word: str, language: str) -> str:
+# Unicode-aware word tokens, plus an equivalent ASCII-only pattern that is
+# cheaper for ASCII text
+_WORD_PATTERN = re.compile(r'\w+')
+_ASCII_WORD_PATTERN = re.compile(r'\w+', re.ASCII)
+# Splits text into alternating separators and words (words at odd indexes)
+_WORD_SPLIT_PATTERN = re.compile(r'(\w+)')
+
+# Whitespace runs (anywhere, or within a line), digits, and non-space tokens
+# containing a digit
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_INLINE_WHITESPACE_PATTERN = re.compile(r'[^\S\n]+')
+_DIGIT_PATTERN = re.compile(r'\d')
+# Anchored at the start of a non-space run so the scan does not retry inside words
+_DIGIT_TOKEN_PATTERN = re.compile(r'(?<!\S)\S*\d\S*')
+
+# Control characters \x01-\x09 mapped back to the \1-\9 backreferences they
+# were read from, and the same characters when not escaped by a backslash
+_BACKREFERENCE_TABLE = {code: f'\\{code}' for code in range(1, 10)}
+_BACKREFERENCE_BYTE_PATTERN = re.compile(r'(?<!\\)[\x01-\x09]')
+
+
+# Sentence delimiters kept as markers when bigrams must not cross sentences
+_SENTENCE_DELIMITERS = '.!?;\n'
+
+# Every punctuation character becomes a space
+_PUNCTUATION_TABLE = str.maketrans({char: ' ' for char in PUNCTUATION})
+
+# Sentence delimiters become a line break, and every line break is then
+# replaced with a marker. Mapping one character to one character keeps ASCII
+# text on CPython's fast translate path. '<' and '>' are plain punctuation, so
+# the marker ends up as the bare token 'SENT' (see generate_word_count_from_text)
+_SENTENCE_PUNCTUATION_TABLE = str.maketrans({
+    **{char: ' ' for char in '''()-[]{}:'",<>/@#$%^&*_~'''},
+    **{char: '\n' for char in _SENTENCE_DELIMITERS},
+})
+_SENTENCE_MARKER = ' SENT '
+
+# Same tables with ASCII lowercasing folded in, for case-insensitive ASCII text
+_ASCII_LOWER_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+_PUNCTUATION_LOWER_TABLE = {**_ASCII_LOWER_TABLE, **_PUNCTUATION_TABLE}
+_SENTENCE_PUNCTUATION_LOWER_TABLE = {**_ASCII_LOWER_TABLE, **_SENTENCE_PUNCTUATION_TABLE}
+
+# Texts longer than this are preprocessed in line-aligned blocks of about this
+# size, so the intermediate copies made by each pass stay small
+_PREPROCESS_BLOCK_SIZE = 1_000_000
+
+# simplemma language codes for the languages supported by lemmatization
+_SIMPLEMMA_LANGUAGES = {
+    'spanish': 'es',
+    'english': 'en',
+    'french': 'fr',
+    'german': 'de',
+    'italian': 'it',
+    'portuguese': 'pt',
+}
+
+
+@lru_cache(maxsize=200_000)
+def _cached_lemma(word: str, simplemma_lang: str) -> str:
+    """simplemma lemma of a word, looked up once per distinct (word, language)."""
+    return simplemma.lemmatize(word, lang=simplemma_lang)
+
+
+@lru_cache(maxsize=32)
+def _simplemma_language(language: str) -> Optional[str]:
+    """simplemma code for a language name (any case), or None if unsupported."""
+    return _SIMPLEMMA_LANGUAGES.get(language.lower())
+
+
+@lru_cache(maxsize=32)
+def _stopword_set(language: str) -> frozenset:
+    """NLTK stopwords for a language, loaded once per process."""
+    return frozenset(stopwords.words(language))
+
+
+def _spanish_singular(word: str) -> Optional[str]:
     """
-    Normalize a single word to its singular form using lemmatization.
+    Singular form of a Spanish plural using common ending rules.
     
-    Args:
-        word: Single word to normalize
-        language: Language code (e.g., 'spanish', 'english')
-        
-    Returns:
-        Normalized word (singular form)
+    Used as a fallback when simplemma fails. Returns None when no rule applies.
     """
-    if not SIMPLEMMA_AVAILABLE:
-        return word
+    word_lower = word.lower()
+    
+    # Handle common Spanish plural endings
+    if word_lower.endswith('es') and len(word_lower) > 4:
+        if word_lower.endswith('ces'):
+            # luces -> luz, voces -> voz
+            singular = word[:-3] + 'z'
+            if len(singular) >= 3:
+                return singular.capitalize() if word[0].isupper() else singular
+        elif word_lower.endswith('ies'):
+            # países -> país, reyes -> rey
+            if word_lower == 'países':
+                return 'país' if word.islower() else 'País'
+            singular = word[:-3] + 'y'
+            if len(singular) >= 3:
+                return singular.capitalize() if word[0].isupper() else singular
+        else:
+            # mujeres -> mujer, casas -> casa
+            singular = word[:-2]
+            if len(singular) >= 3:
+                return singular.capitalize() if word[0].isupper() else singular
+    elif word_lower.endswith('s') and len(word_lower) > 3:
+        # libros -> libro, casas -> casa
+        singular = word[:-1]
+        if len(singular) >= 3:
+            return singular.capitalize() if word[0].isupper() else singular
     
-    # Map language codes to simplemma language codes
-    lang_map = {
-        'spanish': 'es',
-        'english': 'en',
-        'french': 'fr',
-        'german': 'de',
-        'italian': 'it',
-        'portuguese': 'pt',
-    }
-    
-    simplemma_lang = lang_map.get(language.lower())
-    if simplemma_lang is None:
-        return word
+    return None
+
+
+def _lemmatize(word: str, simplemma_lang: str) -> str:
+    """
+    Lemma of a single word for a simplemma language code.
     
+    Keeps a leading capital, and returns the word unchanged when it is too
+    short, numeric, or has no better lemma.
+    """
     # Skip if word is too short or is a number
     if len(word) < 2 or word.isdigit():
         return word
     
     try:
         # Use simplemma to get the lemma (singular form)
-        lemma = simplemma.lemmatize(word, lang=simplemma_lang)
+        lemma = _cached_lemma(word, simplemma_lang)
         
         # Only replace if lemma is different and makes sense
+        # (simplemma may return the same word if it's already singular or unknown)
         if lemma and lemma.lower() != word.lower() and len(lemma) >= 2:
             # Preserve original case if the word was capitalized
             if word[0].isupper():
@@ -60,37 +153,36 @@ def normalize_single_word(word: str, language: str) -> str:
             return lemma
     except Exception:
         # If lemmatization fails, only use fallback for Spanish
+        # For other languages, simplemma should handle it, so if it fails, skip normalization
         if simplemma_lang == 'es':
-            word_lower = word.lower()
-            
-            # Handle common Spanish plural endings
-            if word_lower.endswith('es') and len(word_lower) > 4:
-                if word_lower.endswith('ces'):
-                    # luces -> luz, voces -> voz
-                    singular = word[:-3] + 'z'
-                    if len(singular) >= 3:
-                        return singular.capitalize() if word[0].isupper() else singular
-                elif word_lower.endswith('ies'):
-                    # países -> país, reyes -> rey
-                    if word_lower == 'países':
-                        return 'país' if word.islower() else 'País'
-                    singular = word[:-3] + 'y'
-                    if len(singular) >= 3:
-                        return singular.capitalize() if word[0].isupper() else singular
-                else:
-                    # mujeres -> mujer, casas -> casa
-                    singular = word[:-2]
-                    if len(singular) >= 3:
-                        return singular.capitalize() if word[0].isupper() else singular
-            elif word_lower.endswith('s') and len(word_lower) > 3:
-                # libros -> libro, casas -> casa
-                singular = word[:-1]
-                if len(singular) >= 3:
-                    return singular.capitalize() if word[0].isupper() else singular
+            singular = _spanish_singular(word)
+            if singular is not None:
+                return singular
     
     return word
 
 
+def normalize_single_word(word: str, language: str) -> str:
+    """
+    Normalize a single word to its singular form using lemmatization.
+    
+    Args:
+        word: Single word to normalize
+        language: Language code (e.g., 'spanish', 'english')
+        
+    Returns:
+        Normalized word (singular form)
+    """
+    if not SIMPLEMMA_AVAILABLE:
+        return word
+    
+    simplemma_lang = _simplemma_language(language)
+    if simplemma_lang is None:
+        return word
+    
+    return _lemmatize(word, simplemma_lang)
+
+
 def normalize_plurals_with_lemmatization(text: str, language: str) -> str:
     """
     Lematize words to their base form using lemmatization.
@@ -112,92 +204,27 @@ def normalize_plurals_with_lemmatization(text: str, language: str) -> str:
         logger.warning('Lemmatization skipped: simplemma is not available.')
         return text
     
-    # Map language codes to simplemma language codes
-    # simplemma supports: es, en, fr, de, it, pt
-    lang_map = {
-        'spanish': 'es',
-        'english': 'en',
-        'french': 'fr',
-        'german': 'de',
-        'italian': 'it',
-        'portuguese': 'pt',
-    }
-    
-    simplemma_lang = lang_map.get(language.lower())
+    simplemma_lang = _simplemma_language(language)
     
     # If language is not supported by simplemma, return text unchanged
     if simplemma_lang is None:
         logger.warning(
             f'Language "{language}" is not supported for plural normalization by simplemma. '
-            f'Supported languages: {", ".join(sorted(lang_map.keys()))}. '
+            f'Supported languages: {", ".join(sorted(_SIMPLEMMA_LANGUAGES))}. '
             f'Plural normalization will be skipped for this language.'
         )
         return text
 
     logger.info(f'Using simplemma lemmatizer for language "{language}".')
     
-    def lemmatize_word(match):
-        word = match.group(0)
-        original_word = word
-        
-        # Skip if word is too short or is a number
-        if len(word) < 2 or word.isdigit():
-            return original_word
-        
-        try:
-            # Use simplemma to get the lemma (singular form)
-            lemma = simplemma.lemmatize(word, lang=simplemma_lang)
-            
-            # Only replace if lemma is different and makes sense
-            # (simplemma may return the same word if it's already singular or unknown)
-            if lemma and lemma.lower() != word.lower() and len(lemma) >= 2:
-                # Preserve original case if the word was capitalized
-                if word[0].isupper():
-                    return lemma.capitalize()
-                return lemma
-        except Exception:
-            # If lemmatization fails, only use fallback for Spanish
-            # For other languages, simplemma should handle it, so if it fails, skip normalization
-            if simplemma_lang == 'es':
-                # Fallback for Spanish: handle common Spanish plural patterns manually
-                # This is only for words that simplemma might not recognize
-                word_lower = word.lower()
-                
-                # Handle common Spanish plural endings
-                if word_lower.endswith('es') and len(word_lower) > 4:
-                    # Try removing 'es' for common patterns
-                    if word_lower.endswith('ces'):
-                        # luces -> luz, voces -> voz
-                        singular = word[:-3] + 'z'
-                        if len(singular) >= 3:
-                            return singular.capitalize() if word[0].isupper() else singular
-                    elif word_lower.endswith('ies'):
-                        # países -> país, reyes -> rey
-                        if word_lower == 'países':
-                            return 'país' if word.islower() else 'País'
-                        singular = word[:-3] + 'y'
-                        if len(singular) >= 3:
-                            return singular.capitalize() if word[0].isupper() else singular
-                    else:
-                        # mujeres -> mujer, casas -> casa
-                        singular = word[:-2]
-                        if len(singular) >= 3:
-                            return singular.capitalize() if word[0].isupper() else singular
-                elif word_lower.endswith('s') and len(word_lower) > 3:
-                    # libros -> libro, casas -> casa
-                    singular = word[:-1]
-                    if len(singular) >= 3:
-                        return singular.capitalize() if word[0].isupper() else singular
-        
-        return original_word
-    
-    # Use word boundaries to match complete words
-    pattern = r'\b\w+\b'
-    result = re.sub(pattern, lemmatize_word, text)
+    # Split on complete words: separators land at even indexes and words at odd
+    # ones, so each distinct word is lemmatized once and put back in place
+    parts = _WORD_SPLIT_PATTERN.split(text)
+    words = parts[1::2]
+    lemmas = {word: _lemmatize(word, simplemma_lang) for word in set(words)}
+    parts[1::2] = [lemmas[word] for word in words]
     
-    return result
-
-
+    return ''.join(parts)
 
 
 def preprocess_text(
@@ -224,40 +251,70 @@ def preprocess_text(
         Preprocessed text with punctuation replaced by spaces (or <SENT> markers for
         sentence delimiters when preserve_sentence_boundaries=True)
     """
+    if len(text) <= _PREPROCESS_BLOCK_SIZE:
+        return _preprocess_block(text, case_sensitive, include_numbers, preserve_sentence_boundaries)
+    
+    # Blocks end at a line break, which no step carries across (it is whitespace
+    # or a sentence marker), so the joined blocks match a single pass
+    processed_blocks = (
+        _preprocess_block(block, case_sensitive, include_numbers, preserve_sentence_boundaries)
+        for block in _iter_line_blocks(text, _PREPROCESS_BLOCK_SIZE)
+    )
+    return ' '.join(block for block in processed_blocks if block)
+
+
+def _iter_line_blocks(text: str, block_size: int):
+    """Yield consecutive slices of text of at least block_size characters, each ending at a line break."""
+    start = 0
+    while start < len(text):
+        end = text.find('\n', start + block_size)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end + 1]
+        start = end + 1
+
+
+def _preprocess_block(
+    text: str,
+    case_sensitive: bool,
+    include_numbers: bool,
+    preserve_sentence_boundaries: bool
+) -> str:
+    """Run the preprocess_text pipeline over a single block of text."""
     # Optionally remove any sequence that contains digits before punctuation handling
     text_clean = text
-    if not include_numbers:
+    if not include_numbers and _DIGIT_PATTERN.search(text_clean):
         # Remove any non-space token that contains at least one digit
         # Examples: covid19, covid-19, A4, 12:30, -14, 1-2
-        text_clean = re.sub(r'\S*\d\S*', ' ', text_clean)
+        # (the plain digit search above is much cheaper than this substitution,
+        # so digit-free text skips it entirely)
+        text_clean = _DIGIT_TOKEN_PATTERN.sub(' ', text_clean)
+    
+    # ASCII text can be lowercased in the same translate pass
+    fold_case = not case_sensitive and text_clean.isascii()
     
     # For bigrams, preserve sentence boundaries with special markers
     if preserve_sentence_boundaries:
-        # Replace sentence delimiters with a special marker
-        text_clean = text_clean.replace('.', ' <SENT> ')
-        text_clean = text_clean.replace('!', ' <SENT> ')
-        text_clean = text_clean.replace('?', ' <SENT> ')
-        text_clean = text_clean.replace(';', ' <SENT> ')
-        text_clean = text_clean.replace('\n', ' <SENT> ')
-        
-        # Replace other punctuation with spaces
-        other_punct = '''()-[]{};:'",<>./?@#$%^&*_~'''.replace('.', '').replace('!', '').replace('?', '').replace(';', '')
-        for punct_char in other_punct:
-            text_clean = text_clean.replace(punct_char, ' ')
+        # Replace sentence delimiters with a marker and other punctuation with spaces
+        text_clean = text_clean.translate(
+            _SENTENCE_PUNCTUATION_LOWER_TABLE if fold_case else _SENTENCE_PUNCTUATION_TABLE
+        )
+        text_clean = text_clean.replace(
+            '\n', _SENTENCE_MARKER.lower() if fold_case else _SENTENCE_MARKER
+        )
     else:
         # Replace all punctuation characters with spaces
         # This is safer than removing them, as it preserves word boundaries
-        for punct_char in PUNCTUATION:
-            text_clean = text_clean.replace(punct_char, ' ')
-    
-    # Normalize multiple spaces to single space
-    text_clean = re.sub(r'\s+', ' ', text_clean)
+        text_clean = text_clean.translate(
+            _PUNCTUATION_LOWER_TABLE if fold_case else _PUNCTUATION_TABLE
+        )
     
-    # Strip leading/trailing spaces
-    text_clean = text_clean.strip()
+    # Normalize multiple spaces to single space and strip both ends in one pass
+    text_clean = ' '.join(text_clean.split())
     
-    # Lowercase if not case sensitive
-    if not case_sensitive:
+    # Lowercase if not case sensitive (and not already folded above)
+    if not case_sensitive and not fold_case:
         text_clean = text_clean.lower()
     
     return text_clean
@@ -294,16 +351,11 @@ def generate_word_count_from_text(
         Dictionary mapping words (or word pairs for bigrams) to their frequencies
     """
     # Tokenize on word boundaries (unicode-aware)
-    tokens = re.findall(r'\b\w+\b', text)
-    
-    # Filter stopwords if needed
-    if not include_stopwords:
-        stopword_set = set(stopwords.words(language))
-        tokens = [token for token in tokens if token not in stopword_set]
+    word_pattern = _ASCII_WORD_PATTERN if text.isascii() else _WORD_PATTERN
+    tokens = word_pattern.findall(text)
     
-    # Remove pure numeric tokens if numbers are not included
-    if not include_numbers:
-        tokens = [token for token in tokens if not token.isdigit()]
+    # Stopwords to filter, if needed
+    stopword_set = frozenset() if include_stopwords else _stopword_set(language)
     
     # Build frequency dictionary based on n-gram mode
     ngram = ngram.lower().strip()
@@ -311,32 +363,41 @@ def generate_word_count_from_text(
         raise ValueError(f'Invalid ngram value: {ngram}. Expected "unigram" or "bigram".')
     
     if ngram == "unigram":
+        # Count every token, then drop stopwords and pure numeric tokens once
+        # per distinct word rather than once per occurrence
         counts = Counter(tokens)
-        return dict(counts)
+        return {
+            token: count
+            for token, count in counts.items()
+            if token not in stopword_set and (include_numbers or not token.isdigit())
+        }
+    
+    # Bigrams are formed over the filtered sequence: drop stopwords and, if
+    # numbers are not included, pure numeric tokens in a single pass
+    if not include_stopwords or not include_numbers:
+        tokens = [
+            token for token in tokens
+            if token not in stopword_set and (include_numbers or not token.isdigit())
+        ]
     
     # Bigram mode: count adjacent pairs only (no unigrams)
     # Respect sentence boundaries marked by <SENT> token
     if len(tokens) < 2:
         return {}
     
-    bigrams = []
-    for i in range(len(tokens) - 1):
-        token_a = tokens[i]
-        token_b = tokens[i + 1]
-        
-        # Skip if either token is a sentence boundary marker
-        # Note: '<SENT>' becomes 'sent' after lowercase and punctuation removal
-        if token_a == 'sent' or token_b == 'sent':
-            continue
-        
-        # Skip bigrams that contain any digits in either token (if not include_numbers)
-        if not include_numbers:
-            if re.search(r'\d', token_a) or re.search(r'\d', token_b):
-                continue
-        
-        bigrams.append(f"{token_a} {token_b}")
-    
-    counts = Counter(bigrams)
+    # Flag each token once: sentence boundary markers and (if not include_numbers)
+    # tokens containing any digit cannot be part of a bigram
+    # Note: '<SENT>' becomes 'sent' after lowercase and punctuation removal
+    skip = [
+        token == 'sent' or (not include_numbers and _DIGIT_PATTERN.search(token) is not None)
+        for token in tokens
+    ]
+    
+    counts = Counter(
+        f"{token_a} {token_b}"
+        for token_a, token_b, skip_a, skip_b in zip(tokens, tokens[1:], skip, skip[1:])
+        if not (skip_a or skip_b)
+    )
     return dict(counts)
 
 
@@ -350,7 +411,58 @@ def normalize_spaces(text: str) -> str:
     Returns:
         Text with normalized spaces
     """
-    return re.sub(r'\s+', ' ', text)
+    return _WHITESPACE_PATTERN.sub(' ', text)
+
+
+def _literal_pattern(item: str, case_sensitive: bool) -> Optional[re.Pattern]:
+    """
+    Compile an exclusion/replacement item into an exact-match pattern.
+    
+    Single words are matched as whole words; multi-word phrases (spaces
+    normalized) are matched exactly. Blank items yield None.
+    """
+    if not item.strip():
+        return None
+    
+    normalized_item = normalize_spaces(item.strip())
+    escaped_item = re.escape(normalized_item)
+    if ' ' not in normalized_item:
+        escaped_item = r'\b' + escaped_item + r'\b'
+    
+    return re.compile(escaped_item, 0 if case_sensitive else re.IGNORECASE)
+
+
+def _exclusion_patterns(excluded_items: List[str], case_sensitive: bool) -> List[re.Pattern]:
+    """
+    Compile exclusion items in order, merging each run of consecutive
+    single-word items into one whole-word alternation.
+    
+    A whole-word match always spans a complete word, so removing it never
+    creates, splits or joins another word: within such a run the removal
+    order does not matter and one pass gives the same result as one per item.
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    patterns = []
+    words = []
+    
+    for item in excluded_items:
+        if not item.strip():
+            continue
+        
+        normalized_item = normalize_spaces(item.strip())
+        if _WORD_PATTERN.fullmatch(normalized_item):
+            words.append(re.escape(normalized_item))
+            continue
+        
+        if words:
+            patterns.append(re.compile(r'\b(?:' + '|'.join(words) + r')\b', flags))
+            words = []
+        patterns.append(_literal_pattern(item, case_sensitive))
+    
+    if words:
+        patterns.append(re.compile(r'\b(?:' + '|'.join(words) + r')\b', flags))
+    
+    return patterns
 
 
 def remove_excluded_text(
@@ -379,48 +491,21 @@ def remove_excluded_text(
     if not excluded_items:
         return text
     
-    # Process line by line to preserve line structure
-    lines = text.split('\n')
-    result_lines = []
+    # Compile each item once, in order
+    patterns = _exclusion_patterns(excluded_items, case_sensitive)
     
-    for line in lines:
-        # Normalize spaces in the line for matching
-        normalized_line = normalize_spaces(line)
-        processed_line = normalized_line
-        
-        # Process each excluded item
-        for item in excluded_items:
-            if not item.strip():
-                continue
-            
-            # Normalize spaces in the excluded item
-            normalized_item = normalize_spaces(item.strip())
-            
-            # Build regex pattern
-            # For single words, use word boundaries
-            # For phrases, match exactly (spaces already normalized)
-            if ' ' in normalized_item:
-                # Multi-word phrase: match exactly
-                # Escape special regex characters
-                escaped_item = re.escape(normalized_item)
-                pattern = escaped_item
-            else:
-                # Single word: match as whole word
-                escaped_item = re.escape(normalized_item)
-                pattern = r'\b' + escaped_item + r'\b'
-            
-            # Apply case sensitivity
-            flags = 0 if case_sensitive else re.IGNORECASE
-            
-            # Remove all occurrences
-            processed_line = re.sub(pattern, '', processed_line, flags=flags)
-        
-        # Clean up any double spaces that might result from removals
-        processed_line = normalize_spaces(processed_line)
-        
-        result_lines.append(processed_line)
+    # Normalize spaces within each line, keeping line breaks to preserve line
+    # structure. Patterns never contain a line break, so each one can then run
+    # over the whole text in a single pass with the same result as running it
+    # on every line
+    processed_text = _INLINE_WHITESPACE_PATTERN.sub(' ', text)
     
-    return '\n'.join(result_lines)
+    # Remove all occurrences of each item
+    for pattern in patterns:
+        processed_text = pattern.sub('', processed_text)
+    
+    # Clean up any double spaces that might result from removals
+    return _INLINE_WHITESPACE_PATTERN.sub(' ', processed_text)
 
 
 def apply_literal_replacements(
@@ -445,28 +530,34 @@ def apply_literal_replacements(
     if not replacements:
         return text
     
+    compiled_replacements = []
+    for search, replacement in replacements:
+        pattern = _literal_pattern(search, case_sensitive)
+        if pattern is not None:
+            compiled_replacements.append((pattern, replacement))
+    
+    # Without a line break or escape in any replacement, no line break can be
+    # introduced, so (as in remove_excluded_text) each pattern can run over the
+    # whole text once with the same result as running it on every line
+    may_break_lines = any(
+        '\n' in replacement or '\\' in replacement
+        for _, replacement in compiled_replacements
+    )
+    if not may_break_lines:
+        processed_text = _INLINE_WHITESPACE_PATTERN.sub(' ', text)
+        for pattern, replacement in compiled_replacements:
+            processed_text = pattern.sub(replacement, processed_text)
+        return _INLINE_WHITESPACE_PATTERN.sub(' ', processed_text)
+    
     lines = text.split('\n')
     result_lines = []
     
     for line in lines:
-        normalized_line = normalize_spaces(line)
-        processed_line = normalized_line
+        processed_line = normalize_spaces(line)
         
-        for search, replacement in replacements:
-            if not search.strip():
-                continue
-            
-            normalized_search = normalize_spaces(search.strip())
-            
-            if ' ' in normalized_search:
-                escaped_search = re.escape(normalized_search)
-                pattern = escaped_search
-            else:
-                escaped_search = re.escape(normalized_search)
-                pattern = r'\b' + escaped_search + r'\b'
-            
-            flags = 0 if case_sensitive else re.IGNORECASE
-            processed_line = re.sub(pattern, replacement, processed_line, flags=flags)
+        # Replacements may introduce line breaks, so they stay per line
+        for pattern, replacement in compiled_replacements:
+            processed_line = pattern.sub(replacement, processed_line)
         
         processed_line = normalize_spaces(processed_line)
         result_lines.append(processed_line)
@@ -499,9 +590,8 @@ def parse_exclude_words_argument(exclude_words_arg: Optional[str]) -> List[str]:
     if os.path.isfile(exclude_words_arg):
         try:
             with open(exclude_words_arg, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            # Remove empty lines and strip whitespace
-            items = [line.strip() for line in lines if line.strip()]
+                # Remove empty lines and strip whitespace, one line at a time
+                items = [item for item in (line.strip() for line in f) if item]
             return items
         except Exception as e:
             from src.file_handlers import FileHandlerError
@@ -513,11 +603,21 @@ def parse_exclude_words_argument(exclude_words_arg: Optional[str]) -> List[str]:
     return items
 
 
-@dataclass
+@dataclass(slots=True)
 class RegexRule:
     """Represents a regex transformation rule."""
     pattern: str
     replacement: Optional[str] = None  # None means remove (empty replacement)
+    _compiled: Dict[int, re.Pattern] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def compiled(self, flags: int = 0) -> re.Pattern:
+        """Return the pattern compiled with the given flags, compiling it once per rule."""
+        compiled_pattern = self._compiled.get(flags)
+        if compiled_pattern is None:
+            compiled_pattern = self._compiled[flags] = re.compile(self.pattern, flags)
+        return compiled_pattern
 
 
 def parse_regex_rule_argument(regex_rule_arg: Optional[str]) -> List[RegexRule]:
@@ -552,24 +652,22 @@ def parse_regex_rule_argument(regex_rule_arg: Optional[str]) -> List[RegexRule]:
     # Check if it's a file path that exists
     if os.path.isfile(regex_rule_arg):
         try:
-            with open(regex_rule_arg, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
             rules = []
-            for line_num, line in enumerate(lines, 1):
-                line = line.strip()
-                if not line or line.startswith('#'):  # Skip empty lines and comments
-                    continue
-                
-                try:
-                    rule = _parse_single_regex_rule(line)
-                    if rule:
-                        rules.append(rule)
-                except ValueError as e:
-                    from src.file_handlers import FileHandlerError
-                    raise FileHandlerError(
-                        f'Invalid regex rule at line {line_num} in {regex_rule_arg}: {e}'
-                    )
+            with open(regex_rule_arg, 'r', encoding='utf-8') as f:
+                for line_num, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line or line.startswith('#'):  # Skip empty lines and comments
+                        continue
+                    
+                    try:
+                        rule = _parse_single_regex_rule(line)
+                        if rule:
+                            rules.append(rule)
+                    except ValueError as e:
+                        from src.file_handlers import FileHandlerError
+                        raise FileHandlerError(
+                            f'Invalid regex rule at line {line_num} in {regex_rule_arg}: {e}'
+                        )
             
             return rules
         except Exception as e:
@@ -634,13 +732,15 @@ def _parse_single_regex_rule(rule_string: str) -> Optional[RegexRule]:
     if not pattern:
         return None
     
-    # Validate regex pattern by compiling it
+    rule = RegexRule(pattern=pattern, replacement=replacement)
+    
+    # Validate regex pattern by compiling it (kept on the rule for reuse)
     try:
-        re.compile(pattern)
+        rule.compiled()
     except re.error as e:
         raise ValueError(f'Invalid regex pattern "{pattern}": {e}')
     
-    return RegexRule(pattern=pattern, replacement=replacement)
+    return rule
 
 
 def _normalize_backreferences(replacement: str) -> str:
@@ -659,23 +759,30 @@ def _normalize_backreferences(replacement: str) -> str:
     Returns:
         Replacement string with normalized backreferences
     """
-    result = []
-    i = 0
-    while i < len(replacement):
-        char = replacement[i]
-        # Check if this is a control character that could be a backreference
-        # Backreferences are \1 through \9 (bytes 1-9)
-        # Only treat as backreference if not preceded by backslash
-        if ord(char) >= 1 and ord(char) <= 9 and (i == 0 or replacement[i-1] != '\\'):
-            # This looks like a backreference byte, convert to string representation
-            backref_num = ord(char)
-            result.append(f'\\{backref_num}')
-            i += 1
-        else:
-            result.append(char)
-            i += 1
+    # Backreferences are \1 through \9 (bytes 1-9)
+    if '\\' not in replacement:
+        # No backslash can guard a control character, so convert them all
+        return replacement.translate(_BACKREFERENCE_TABLE)
     
-    return ''.join(result)
+    # Only treat as backreference if not preceded by backslash
+    return _BACKREFERENCE_BYTE_PATTERN.sub(
+        lambda match: _BACKREFERENCE_TABLE[ord(match.group())],
+        replacement
+    )
+
+
+@lru_cache(maxsize=256)
+def _required_literal(pattern: str) -> Optional[str]:
+    """
+    Literal text that every match of a pattern contains, or None.
+    
+    Only plain patterns (no metacharacters, optionally anchored with a
+    leading ^) are recognized.
+    """
+    literal = pattern[1:] if pattern.startswith('^') else pattern
+    if literal and re.escape(literal) == literal:
+        return literal
+    return None
 
 
 def apply_regex_transformations(
@@ -716,13 +823,23 @@ def apply_regex_transformations(
             continue
         
         try:
+            pattern = rule.compiled(flags)
             if rule.replacement is None:
+                # Nothing to remove from empty text, or (case-sensitive only,
+                # where a substring test is exact) when a plain pattern's
+                # literal does not occur at all
+                if not result:
+                    continue
+                literal = _required_literal(rule.pattern) if case_sensitive else None
+                if literal is not None and literal not in result:
+                    continue
+                
                 # Remove matches (empty replacement)
-                result = re.sub(rule.pattern, '', result, flags=flags)
+                result = pattern.sub('', result)
             else:
                 # Replace matches
                 # Note: Python's re.sub uses backreferences like \1, \2, etc.
-                result = re.sub(rule.pattern, rule.replacement, result, flags=flags)
+                result = pattern.sub(rule.replacement, result)
         except re.error as e:
             raise ValueError(f'Error applying regex rule "{rule.pattern}": {e}')
         except Exception as e:
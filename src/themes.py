@@ -7,8 +7,9 @@ for beautiful, ready-to-use word clouds.
 For complete theme documentation, see THEMES.md in the project root.
 """
 
-from dataclasses import dataclass
-from typing import Optional, Dict
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Optional, Dict, Mapping, Tuple
 from src.config import WordCloudConfig
 
 # Import colormap registration for custom color palettes
@@ -16,8 +17,13 @@ from src.config import WordCloudConfig
 # All themes defined in this file are built-in themes available to users
 from src.custom_colormaps import register_custom_colormap
 
-# Available themes registry
-THEMES: Dict[str, 'Theme'] = {}
+# Available themes registry, keyed by lowercase name. Only
+# register_theme writes to it; THEMES is a read-only live view
+_THEMES: Dict[str, 'Theme'] = {}
+THEMES: Mapping[str, 'Theme'] = MappingProxyType(_THEMES)
+
+# Sorted theme names, rebuilt on first use after a registration
+_theme_names: Optional[Tuple[str, ...]] = None
 
 
 @dataclass
@@ -45,34 +51,28 @@ class Theme:
         Returns:
             New WordCloudConfig with theme applied
         """
-        # Create a copy of the config
-        new_config = WordCloudConfig(
-            canvas_width=config.canvas_width,
-            canvas_height=config.canvas_height,
-            max_words=config.max_words,
-            min_word_length=config.min_word_length,
-            lemmatize=config.lemmatize,
-            include_numbers=config.include_numbers,
-            background_color=config.background_color or self.background_color,
-            font_color=config.font_color if config.font_color is not None else self.font_color,
-            colormap=config.colormap if config.colormap is not None else self.colormap,
-            relative_scaling=config.relative_scaling if config.relative_scaling != 0.5 else self.relative_scaling,
-            prefer_horizontal=config.prefer_horizontal if config.prefer_horizontal != 0.9 else self.prefer_horizontal,
-            mask=config.mask,
-            contour_width=config.contour_width,
-            contour_color=config.contour_color,
-            font_path=config.font_path,
-            language=config.language,
-            include_stopwords=config.include_stopwords,
-            case_sensitive=config.case_sensitive,
-            ngram=config.ngram
-        )
-        return new_config
+        # Theme values for the settings left unset/default in the config
+        overrides = {}
+        if not config.background_color:
+            overrides['background_color'] = self.background_color
+        if config.font_color is None:
+            overrides['font_color'] = self.font_color
+        if config.colormap is None:
+            overrides['colormap'] = self.colormap
+        if config.relative_scaling == 0.5:
+            overrides['relative_scaling'] = self.relative_scaling
+        if config.prefer_horizontal == 0.9:
+            overrides['prefer_horizontal'] = self.prefer_horizontal
+        
+        # Copy of the config with every other field unchanged
+        return replace(config, **overrides)
 
 
 def register_theme(theme: Theme) -> None:
     """Register a theme in the global themes registry."""
-    THEMES[theme.name.lower()] = theme
+    global _theme_names
+    _THEMES[theme.name.lower()] = theme
+    _theme_names = None
 
 
 def get_theme(name: str) -> Optional[Theme]:
@@ -85,526 +85,447 @@ def get_theme(name: str) -> Optional[Theme]:
     Returns:
         Theme object or None if not found
     """
-    return THEMES.get(name.lower())
+    # Names are usually passed already in lowercase
+    theme = _THEMES.get(name)
+    if theme is None:
+        theme = _THEMES.get(name.lower())
+    return theme
 
 
 def list_themes() -> Dict[str, Theme]:
     """Get all registered themes."""
-    return THEMES.copy()
+    return _THEMES.copy()
 
 
 def get_theme_names() -> list:
     """Get list of all registered theme names."""
-    return sorted(THEMES.keys())
+    global _theme_names
+    if _theme_names is None:
+        _theme_names = tuple(sorted(_THEMES))
+    return list(_theme_names)
 
 
 # Define preset themes
-_playroom = Theme(
-    name="playroom",
-    background_color="#ffffff",
-    font_color=None,
-    colormap="crayons",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="White background with cheerful colors. Bright and cheerful."
-)
-register_theme(_playroom)
-
-_jungle = Theme(
-    name="jungle",
-    background_color="#76E864",
-    font_color=None,
-    colormap="greens_dark",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Green background with green colors."
-)
-register_theme(_jungle)
-
-_garden = Theme(
-    name="garden",
-    background_color="#B8F194",
-    font_color=None,
-    colormap="garden_with_flowers",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="White background with green colors."
-)
-register_theme(_garden)
-
-_brazil = Theme(
-    name="brazil",
-    background_color="#FFE539",
-    font_color=None,
-    colormap="blue_green_vibrant",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Brazilian colors palette."
-)
-register_theme(_brazil)
-
-_woods = Theme(
-    name="woods",
-    background_color="#218D4C",
-    font_color=None,
-    colormap="greens_light",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Light green on dark green. Mysterious woods."
-)
-register_theme(_woods)
-
-_fluorescent = Theme(
-    name="fluorescent",
-    background_color="#2A2A2A",
-    font_color=None,
-    colormap="greens_light",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Light green shining in the dark."
-)
-register_theme(_fluorescent)
-
-_mint = Theme(
-    name="mint",
-    background_color="#5FB89D",
-    font_color=None,
-    colormap="greens_light",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Fresh and minty theme."
-)
-register_theme(_mint)
-
-_stars = Theme(
-    name="stars",
-    background_color="#1F1F40",
-    font_color=None,
-    colormap="blues_light",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Like stars in the sky on a dark night."
-)
-register_theme(_stars)
-
-_lake = Theme(
-    name="lake",
-    background_color="#1B5274",
-    font_color=None,
-    colormap="blues_bright",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Blue like a dark lake."
-)
-register_theme(_lake)
-
-_river = Theme(
-    name="river",
-    background_color="#7299BD",
-    font_color=None,
-    colormap="blues_light",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Like a shinny river."
-)
-register_theme(_river)
-
-_solarized = Theme(
-    name="solarized",
-    background_color="#FFC98B",
-    font_color=None,
-    colormap="blues_dark",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Blue letters on vibrant ocre background."
-)
-register_theme(_solarized)
-
+_BUILTIN_THEMES = (
+    Theme(
+        name="playroom",
+        background_color="#ffffff",
+        font_color=None,
+        colormap="crayons",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="White background with cheerful colors. Bright and cheerful."
+    ),
+    Theme(
+        name="jungle",
+        background_color="#76E864",
+        font_color=None,
+        colormap="greens_dark",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Green background with green colors."
+    ),
+    Theme(
+        name="garden",
+        background_color="#B8F194",
+        font_color=None,
+        colormap="garden_with_flowers",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="White background with green colors."
+    ),
+    Theme(
+        name="brazil",
+        background_color="#FFE539",
+        font_color=None,
+        colormap="blue_green_vibrant",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Brazilian colors palette."
+    ),
+    Theme(
+        name="woods",
+        background_color="#218D4C",
+        font_color=None,
+        colormap="greens_light",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Light green on dark green. Mysterious woods."
+    ),
+    Theme(
+        name="fluorescent",
+        background_color="#2A2A2A",
+        font_color=None,
+        colormap="greens_light",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Light green shining in the dark."
+    ),
+    Theme(
+        name="mint",
+        background_color="#5FB89D",
+        font_color=None,
+        colormap="greens_light",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Fresh and minty theme."
+    ),
+    Theme(
+        name="stars",
+        background_color="#1F1F40",
+        font_color=None,
+        colormap="blues_light",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Like stars in the sky on a dark night."
+    ),
+    Theme(
+        name="lake",
+        background_color="#1B5274",
+        font_color=None,
+        colormap="blues_bright",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Blue like a dark lake."
+    ),
+    Theme(
+        name="river",
+        background_color="#7299BD",
+        font_color=None,
+        colormap="blues_light",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Like a shinny river."
+    ),
+    Theme(
+        name="solarized",
+        background_color="#FFC98B",
+        font_color=None,
+        colormap="blues_dark",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Blue letters on vibrant ocre background."
+    ),
+    Theme(
+        name="office",
+        background_color="#FFFFFF",
+        font_color=None,
+        colormap="grey_blue_dark",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Blue and grey letters on white. Elegant and simple."
+    ),
+    Theme(
+        name="pinky",
+        background_color="#000000",
+        font_color=None,
+        colormap="pinkies",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Pink and purple letters on black. Vibrant and fun."
+    ),
+    Theme(
+        name="neon",
+        background_color="#000000",
+        font_color=None,
+        colormap="neon",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Neon colors palette on black. Vibrant and fun."
+    ),
+    Theme(
+        name="markers",
+        background_color="#1A284E",
+        font_color=None,
+        colormap="neon",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Neon colors palette on black. Vibrant and fun."
+    ),
+    Theme(
+        name="golden",
+        background_color="#FDD67B",
+        font_color=None,
+        colormap="goldens_dark",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Golden colors palette on black. Vibrant and fun."
+    ),
+    Theme(
+        name="pharaon",
+        background_color="#063866",
+        font_color=None,
+        colormap="goldens_dark",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Golden letters on dark blue."
+    ),
+    Theme(
+        name="cadiz",
+        background_color="#0C88C2",
+        font_color=None,
+        colormap="goldens_light",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Like Cadiz beach, maybe."
+    ),
+    Theme(
+        name="clouds",
+        background_color="#0C88C2",
+        font_color=None,
+        colormap="blues_light",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Blue letters on white clouds."
+    ),
+    Theme(
+        name="strawberry",
+        background_color="#DE7998",
+        font_color=None,
+        colormap="reds_dark",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Red letters on strawberry background."
+    ),
+    Theme(
+        name="piruleta",
+        background_color="#6D0E2A",
+        font_color=None,
+        colormap="reds_light",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Vibrant red theme, like a piruleta."
+    ),
+    Theme(
+        name="blood",
+        background_color="#1D0109",
+        font_color=None,
+        colormap="reds_dark",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Dark red letters on dark red background."
+    ),
+    Theme(
+        name="high_contrast",
+        background_color="#FFFFFF",
+        font_color=None,
+        colormap="greys_dark",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Dark letters on white background, high contrast."
+    ),
+    Theme(
+        name="soft",
+        background_color="#FFFFFF",
+        font_color=None,
+        colormap="greys_light",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Light letters on white background, soft."
+    ),
+    Theme(
+        name="grey",
+        background_color="#3F3E40",
+        font_color=None,
+        colormap="greys_light",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Light letters on grey background."
+    ),
+    Theme(
+        name="elegance",
+        background_color="#355690",
+        font_color=None,
+        colormap="greys_light",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Light grey letters on blue. Elegant and quiet."
+    ),
+    Theme(
+        name="gum",
+        background_color="#FF86BF",
+        font_color=None,
+        colormap="pink_dark",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Dark red letters on pink background. Gum theme."
+    ),
+    Theme(
+        name="sakura",
+        background_color="#FFE8F3",
+        font_color=None,
+        colormap="sakura_palette",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Like sakura leaves flying in the wind."
+    ),
+    Theme(
+        name="gossip",
+        background_color="#32272E",
+        font_color=None,
+        colormap="sakura_palette",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Pink and grey letters on dark grey background."
+    ),
+    Theme(
+        name="halloween",
+        background_color="#000000",
+        font_color=None,
+        colormap="pumpkins",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Pumpkin-like colors palette, vibrant version."
+    ),
+    Theme(
+        name="carrots",
+        background_color="#E8AF79",
+        font_color=None,
+        colormap="pumpkins",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Pumpkin-like colors palette, vibrant version."
+    ),
+    Theme(
+        name="joy",
+        background_color="#3B536A",
+        font_color=None,
+        colormap="pastels",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Pastels colors palette on blue background."
+    ),
+    Theme(
+        name="blackboard",
+        background_color="#323232",
+        font_color=None,
+        colormap="pastels",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Like a colorful blackboard."
+    ),
+    Theme(
+        name="sauvage",
+        background_color="#000000",
+        font_color=None,
+        colormap="rainbow",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Rainbow colors palette on black background."
+    ),
+    Theme(
+        name="loretta",
+        background_color="#200D5F",
+        font_color=None,
+        colormap="rainbow",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Rainbow colors palette on vibrant dark blue background."
+    ),
+    Theme(
+        name="old",
+        background_color="#585142",
+        font_color=None,
+        colormap="greys_light",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Like an old document."
+    ),
+    Theme(
+        name="sober",
+        background_color="#E0DCD8",
+        font_color=None,
+        colormap="sober_colors",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Sober colors palette, warm and elegant."
+    ),
+    Theme(
+        name="homely",
+        background_color="#E3D1BB",
+        font_color=None,
+        colormap="sober_colors",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Sober colors palette, warm and elegant."
+    ),
+    Theme(
+        name="spring",
+        background_color="#1BA891",
+        font_color=None,
+        colormap="pink_light",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Spring colors palette, bright and cheerful."
+    ),
+    Theme(
+        name="summer",
+        background_color="#004697",
+        font_color=None,
+        colormap="colorful_palette",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Summer colors palette, warm and vibrant."
+    ),
+    Theme(
+        name="autumn",
+        background_color="#5F2E0F",
+        font_color=None,
+        colormap="goldens_dark",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Autumn colors palette, cozy and warm."
+    ),
+    Theme(
+        name="winter",
+        background_color="#6689AF",
+        font_color=None,
+        colormap="blues_light",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Winter colors palette, cold and serene."
+    ),
+    Theme(
+        name="night",
+        background_color="#1A0000",
+        font_color=None,
+        colormap="blue_green_dark",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Night colors palette, dark and mysterious."
+    ),
+    Theme(
+        name="day",
+        background_color="#EEE8CB",
+        font_color=None,
+        colormap="blue_green_dark",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Day colors palette, bright and cheerful."
+    ),
+    Theme(
+        name="radical",
+        background_color="#003DE3",
+        font_color=None,
+        colormap="neon",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Radical colors palette, intense and energetic."
+    ),
+    Theme(
+        name="bombons",
+        background_color="#311405",
+        font_color=None,
+        colormap="crayons",
+        relative_scaling=0.6,
+        prefer_horizontal=0.8,
+        description="Vibrant colors on chocolate. Like a chocolate box."
+    ),
+)
+
+for _theme in _BUILTIN_THEMES:
+    register_theme(_theme)
 
-_office = Theme(
-    name="office",
-    background_color="#FFFFFF",
-    font_color=None,
-    colormap="grey_blue_dark",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Blue and grey letters on white. Elegant and simple."
-)
-register_theme(_office)
-
-_pinky = Theme(
-    name="pinky",
-    background_color="#000000",
-    font_color=None,
-    colormap="pinkies",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Pink and purple letters on black. Vibrant and fun."
-)
-register_theme(_pinky)
-
-_neon = Theme(
-    name="neon",
-    background_color="#000000",
-    font_color=None,
-    colormap="neon",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Neon colors palette on black. Vibrant and fun."
-)
-register_theme(_neon)
-
-_markers = Theme(
-    name="markers",
-    background_color="#1A284E",
-    font_color=None,
-    colormap="neon",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Neon colors palette on black. Vibrant and fun."
-)
-register_theme(_markers)
-
-_golden = Theme(
-    name="golden",
-    background_color="#FDD67B",
-    font_color=None,
-    colormap="goldens_dark",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Golden colors palette on black. Vibrant and fun."
-)
-register_theme(_golden)
-
-_pharaon = Theme(
-    name="pharaon",
-    background_color="#063866",
-    font_color=None,
-    colormap="goldens_dark",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Golden letters on dark blue."
-)
-register_theme(_pharaon)
-
-_cadiz = Theme(
-    name="cadiz",
-    background_color="#0C88C2",
-    font_color=None,
-    colormap="goldens_light",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Like Cadiz beach, maybe."
-)
-register_theme(_cadiz)
-
-_clouds = Theme(
-    name="clouds",
-    background_color="#0C88C2",
-    font_color=None,
-    colormap="blues_light",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Blue letters on white clouds."
-)
-register_theme(_clouds)
-
-_strawberry = Theme(
-    name="strawberry",
-    background_color="#DE7998",
-    font_color=None,
-    colormap="reds_dark",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Red letters on strawberry background."
-)
-register_theme(_strawberry)
-
-_piruleta = Theme(
-    name="piruleta",
-    background_color="#6D0E2A",
-    font_color=None,
-    colormap="reds_light",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Vibrant red theme, like a piruleta."
-)
-register_theme(_piruleta)
-
-_blood = Theme(
-    name="blood",
-    background_color="#1D0109",
-    font_color=None,
-    colormap="reds_dark",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Dark red letters on dark red background."
-)
-register_theme(_blood)
-
-_high_contrast = Theme(
-    name="high_contrast",
-    background_color="#FFFFFF",
-    font_color=None,
-    colormap="greys_dark",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Dark letters on white background, high contrast."
-)
-register_theme(_high_contrast)
-
-_soft = Theme(
-    name="soft",
-    background_color="#FFFFFF",
-    font_color=None,
-    colormap="greys_light",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Light letters on white background, soft."
-)
-register_theme(_soft)
-
-_grey = Theme(
-    name="grey",
-    background_color="#3F3E40",
-    font_color=None,
-    colormap="greys_light",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Light letters on grey background."
-)
-register_theme(_grey)
-
-_elegance = Theme(
-    name="elegance",
-    background_color="#355690",
-    font_color=None,
-    colormap="greys_light",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Light grey letters on blue. Elegant and quiet."
-)
-register_theme(_elegance)
-
-_gum = Theme(
-    name="gum",
-    background_color="#FF86BF",
-    font_color=None,
-    colormap="pink_dark",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Dark red letters on pink background. Gum theme."
-)
-register_theme(_gum)
-
-_sakura = Theme(
-    name="sakura",
-    background_color="#FFE8F3",
-    font_color=None,
-    colormap="sakura_palette",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Like sakura leaves flying in the wind."
-)
-register_theme(_sakura)
-
-_gossip = Theme(
-    name="gossip",
-    background_color="#32272E",
-    font_color=None,
-    colormap="sakura_palette",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Pink and grey letters on dark grey background."
-)
-register_theme(_gossip)
-
-_halloween = Theme(
-    name="halloween",
-    background_color="#000000",
-    font_color=None,
-    colormap="pumpkins",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Pumpkin-like colors palette, vibrant version."
-)
-register_theme(_halloween)
-
-_carrots = Theme(
-    name="carrots",
-    background_color="#E8AF79",
-    font_color=None,
-    colormap="pumpkins",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Pumpkin-like colors palette, vibrant version."
-)
-register_theme(_carrots)
-
-_joy = Theme(
-    name="joy",
-    background_color="#3B536A",
-    font_color=None,
-    colormap="pastels",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Pastels colors palette on blue background."
-)
-register_theme(_joy)
-
-_blackboard = Theme(
-    name="blackboard",
-    background_color="#323232",
-    font_color=None,
-    colormap="pastels",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Like a colorful blackboard."
-)
-register_theme(_blackboard)
-
-_sauvage = Theme(
-    name="sauvage",
-    background_color="#000000",
-    font_color=None,
-    colormap="rainbow",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Rainbow colors palette on black background."
-)
-register_theme(_sauvage)
-
-_loretta  = Theme(
-    name="loretta",
-    background_color="#200D5F",
-    font_color=None,
-    colormap="rainbow",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Rainbow colors palette on vibrant dark blue background."
-)
-register_theme(_loretta)
-
-_old = Theme(
-    name="old",
-    background_color="#585142",
-    font_color=None,
-    colormap="greys_light",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Like an old document."
-)
-register_theme(_old)
-
-_sober = Theme(
-    name="sober",
-    background_color="#E0DCD8",
-    font_color=None,
-    colormap="sober_colors",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Sober colors palette, warm and elegant."
-)
-register_theme(_sober)
-
-_homely = Theme(
-    name="homely",
-    background_color="#E3D1BB",
-    font_color=None,
-    colormap="sober_colors",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Sober colors palette, warm and elegant."
-)
-register_theme(_homely)
-
-_spring = Theme(
-    name="spring",
-    background_color="#1BA891",
-    font_color=None,
-    colormap="pink_light",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Spring colors palette, bright and cheerful."
-)
-register_theme(_spring)
-
-_summer = Theme(
-    name="summer",
-    background_color="#004697",
-    font_color=None,
-    colormap="colorful_palette",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Summer colors palette, warm and vibrant."
-)
-register_theme(_summer)
-
-_autumn = Theme(
-    name="autumn",
-    background_color="#5F2E0F",
-    font_color=None,
-    colormap="goldens_dark",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Autumn colors palette, cozy and warm."
-)
-register_theme(_autumn)
-
-_winter = Theme(
-    name="winter",
-    background_color="#6689AF",
-    font_color=None,
-    colormap="blues_light",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Winter colors palette, cold and serene."
-)
-register_theme(_winter)
-
-_night = Theme(
-    name="night",
-    background_color="#1A0000",
-    font_color=None,
-    colormap="blue_green_dark",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Night colors palette, dark and mysterious."
-)
-register_theme(_night)
-
-_day = Theme(
-    name="day",
-    background_color="#EEE8CB",
-    font_color=None,
-    colormap="blue_green_dark",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Day colors palette, bright and cheerful."
-)
-register_theme(_day)
-
-_radical = Theme(
-    name="radical",
-    background_color="#003DE3",
-    font_color=None,
-    colormap="neon",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Radical colors palette, intense and energetic."
-)
-register_theme(_radical)
-
-_bombons = Theme(
-    name="bombons",
-    background_color="#311405",
-    font_color=None,
-    colormap="crayons",
-    relative_scaling=0.6,
-    prefer_horizontal=0.8,
-    description="Vibrant colors on chocolate. Like a chocolate box."
-)
-register_theme(_bombons)
 
 # ============================================================================
 # Custom Colormaps for themes
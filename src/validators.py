@@ -2,12 +2,21 @@
 
 import os
 import re
+from functools import lru_cache
 from typing import Optional
 import nltk
 from nltk.corpus import stopwords
 
 from src.config import LANGUAGES_FOR_NLTK, WORDCLOUD_COLORS
 
+# Named colors as a set for membership tests, and the "#RRGGBB" hex format
+_WORDCLOUD_COLOR_SET = frozenset(WORDCLOUD_COLORS)
+_HEX_COLOR_PATTERN = re.compile(r'#[0-9A-Fa-f]{6}')
+
+# Runs of characters other than ASCII letters, digits and hyphens (underscores
+# included, so existing runs of them collapse too)
+_FILENAME_SEPARATOR_PATTERN = re.compile(r'[^a-zA-Z0-9-]+')
+
 
 class ValidationError(Exception):
     """Base exception for validation errors."""
@@ -29,10 +38,13 @@ class FileValidationError(ValidationError):
     pass
 
 
+@lru_cache(maxsize=256)
 def validate_color_reference(color: Optional[str]) -> Optional[str]:
     """
     Validate a color reference (hex code or color name).
     
+    Valid results are cached per color string; invalid ones raise every time.
+    
     Args:
         color: Color string (hex code like "#FF0000" or color name like "red")
         
@@ -47,14 +59,14 @@ def validate_color_reference(color: Optional[str]) -> Optional[str]:
         
     if not color.startswith('#'):
         # Color name validation
-        if color not in WORDCLOUD_COLORS:
+        if color not in _WORDCLOUD_COLOR_SET:
             raise ColorValidationError(
                 f'Invalid color reference: {color}. '
                 f'Valid colors are: {WORDCLOUD_COLORS} or hex codes like "#FF0000"'
             )
     else:
         # Hex code validation
-        if len(color) != 7 or not all(c in '0123456789ABCDEFabcdef' for c in color[1:]):
+        if _HEX_COLOR_PATTERN.fullmatch(color) is None:
             raise ColorValidationError(
                 f'Invalid hex color code: {color}. '
                 f'Expected format: "#RRGGBB" (e.g., "#FF0000")'
@@ -134,6 +146,7 @@ def validate_input_file(input_file: str) -> str:
     return input_file
 
 
+@lru_cache(maxsize=128)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename by removing invalid characters.
@@ -150,12 +163,10 @@ def sanitize_filename(filename: str) -> str:
     # Remove extension if present
     name_without_ext = os.path.splitext(filename)[0]
     
-    # Replace spaces and invalid characters with underscores
+    # Replace spaces and invalid characters with underscores, collapsing runs
+    # of them (and of underscores) into a single underscore in one pass
     # Keep only alphanumeric, hyphens, and underscores
-    sanitized = re.sub(r'[^a-zA-Z0-9_-]', '_', name_without_ext)
-    
-    # Remove multiple consecutive underscores
-    sanitized = re.sub(r'_+', '_', sanitized)
+    sanitized = _FILENAME_SEPARATOR_PATTERN.sub('_', name_without_ext)
     
     # Remove leading/trailing underscores
     sanitized = sanitized.strip('_')
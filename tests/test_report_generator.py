@@ -129,3 +129,80 @@ def test_write_report_pdf_creates_file():
         assert os.path.exists(output_path)
         assert os.path.getsize(output_path) > 0
 
+
+
+def test_report_labels_render_expected_values():
+    from src.report_generator import _get_report_labels
+
+    english = _get_report_labels("en")
+    spanish = _get_report_labels("es")
+    assert english["title"] == "Nubisary Report"
+    assert english["metric_header"] == "Metric"
+    assert english["percent_header"] == "%"
+    assert english["of_unique"] == "of unique tokens"
+    assert spanish["title"] == "Informe Nubisary"
+    assert spanish["metric_header"] == "Métrica"
+    assert spanish["percent_header"] == "%"
+    assert spanish["of_unique"] == "de tokens únicos"
+
+
+def test_spanish_labels_fall_back_to_english_keys():
+    from src.report_generator import _get_report_labels
+
+    english = _get_report_labels("en")
+    spanish = _get_report_labels("es")
+    assert set(spanish) == set(english)
+    assert spanish["title"] == "Informe Nubisary"
+    assert spanish["na"] == english["na"]
+
+
+def test_build_report_data_top_word_insights():
+    frequencies = {"blue": 3.0, "sky": 2.0, "again": 1.0}
+    scenario = ScenarioMetadata(
+        label="Current scenario",
+        language="unknown",
+        ngram="unigram",
+        lemmatize=False,
+        include_stopwords=False,
+        include_numbers=False,
+        case_sensitive=False,
+    )
+    report_data = build_report_data(
+        frequencies=frequencies,
+        scenario=scenario,
+        raw_text="Under the Blue sky.\nA blue sea and a blue\nsky again.",
+        bigram_frequencies={"blue sky": 2.0, "blue sea": 1.0},
+    )
+
+    insights = report_data["top_word_insights"]
+    assert insights.top_terms[:2] == ["blue", "sky"]
+    assert insights.bigrams.available
+    assert [entry["bigram"] for entry in insights.bigrams.items["blue"]] == ["blue sky", "blue sea"]
+    assert insights.examples.available
+    assert insights.examples.items["blue"][0] == "(...) the Blue sky"
+    assert "again" in insights.top_terms
+    assert "again" not in insights.examples.items
+
+
+def test_bigram_examples_match_tokens_lowercased_one_by_one():
+    # Lowercasing the whole text turns this final capital sigma into "σ"
+    # rather than "ς", so the bigram must be matched token by token
+    frequencies = {"ran": 2.0, "οδος": 1.0}
+    scenario = ScenarioMetadata(
+        label="Current scenario",
+        language="unknown",
+        ngram="unigram",
+        lemmatize=False,
+        include_stopwords=False,
+        include_numbers=False,
+        case_sensitive=False,
+    )
+    report_data = build_report_data(
+        frequencies=frequencies,
+        scenario=scenario,
+        raw_text="We ran - ΟΔΟΣ...ok",
+        bigram_frequencies={"ran οδος": 1.0},
+    )
+
+    insights = report_data["top_word_insights"]
+    assert insights.examples.items["ran"] == ["We ran ΟΔΟΣ"]
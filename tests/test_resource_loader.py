@@ -0,0 +1,49 @@
+"""Unit tests for resource_loader module."""
+
+import os
+
+import pytest
+
+from src.resource_loader import list_mask_files
+
+
+@pytest.fixture
+def masks_dir(tmp_path, monkeypatch):
+    """Point the resource base at tmp_path, with an empty mask cache."""
+    monkeypatch.setattr("src.resource_loader._BASE_PATH", str(tmp_path))
+    monkeypatch.setattr("src.resource_loader._MASK_CACHE", {})
+    directory = tmp_path / "samples" / "masks"
+    directory.mkdir(parents=True)
+    (directory / "heart.png").write_bytes(b"")
+    (directory / "circle.jpg").write_bytes(b"")
+    (directory / "notes.txt").write_bytes(b"")
+    os.utime(directory, ns=(1_000_000_000, 1_000_000_000))
+    return directory
+
+
+class TestListMaskFiles:
+    """Tests for list_mask_files function."""
+
+    def test_lists_image_files_sorted(self, masks_dir):
+        """Test that only image files are listed, sorted by name."""
+        assert list_mask_files() == ["circle.jpg", "heart.png"]
+        assert list_mask_files(without_extension=True) == ["circle", "heart"]
+
+    def test_added_and_removed_masks_invalidate_cache(self, masks_dir):
+        """Test that a new directory mtime makes added and removed masks show up."""
+        assert list_mask_files() == ["circle.jpg", "heart.png"]
+
+        (masks_dir / "star.png").write_bytes(b"")
+        os.utime(masks_dir, ns=(2_000_000_000, 2_000_000_000))
+        assert list_mask_files() == ["circle.jpg", "heart.png", "star.png"]
+
+        (masks_dir / "heart.png").unlink()
+        os.utime(masks_dir, ns=(3_000_000_000, 3_000_000_000))
+        assert list_mask_files() == ["circle.jpg", "star.png"]
+
+    def test_callers_get_a_fresh_list(self, masks_dir):
+        """Test that changing a returned list does not change later results."""
+        masks = list_mask_files()
+        masks.append("injected.png")
+        masks.remove("heart.png")
+        assert list_mask_files() == ["circle.jpg", "heart.png"]
@@ -0,0 +1,41 @@
+"""Unit tests for statistics_exporter module."""
+
+import os
+from pathlib import Path
+
+from src.statistics_exporter import export_statistics_csv, export_statistics_json
+
+
+class TestExportStatisticsJson:
+    """Tests for export_statistics_json function."""
+
+    def test_output_matches_standard_json(self, tmp_path):
+        """Test the document is json.dumps(indent=2) output, sorted by frequency."""
+        output = export_statistics_json(
+            {"café": 2.0, "big": 1e16, "nan": float("nan")},
+            str(tmp_path / "stats.json"),
+        )
+        with open(output, encoding="utf-8") as f:
+            content = f.read()
+        assert content == '{\n  "big": 1e+16,\n  "café": 2.0,\n  "nan": NaN\n}'
+
+    def test_path_input_gets_extension(self, tmp_path):
+        """Test that a pathlib.Path is accepted and given the .json extension."""
+        output = export_statistics_json({"word": 1.0}, tmp_path / "stats")
+        assert output == os.path.join(str(tmp_path), "stats.json")
+        assert Path(output).is_file()
+
+    def test_basename_equal_to_extension_is_kept(self, tmp_path):
+        """Test that a file named exactly '.json' is not renamed."""
+        output = export_statistics_json({"word": 1.0}, str(tmp_path / ".json"))
+        assert output == os.path.join(str(tmp_path), ".json")
+
+
+class TestExportStatisticsCsv:
+    """Tests for export_statistics_csv function."""
+
+    def test_uppercase_extension_is_kept(self, tmp_path):
+        """Test that the extension check ignores case."""
+        output = export_statistics_csv({"word": 1.0}, str(tmp_path / "stats.CSV"))
+        assert output == os.path.join(str(tmp_path), "stats.CSV")
+        assert Path(output).is_file()
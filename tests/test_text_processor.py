@@ -37,6 +37,12 @@ class TestPreprocessText:
         result = preprocess_text(text, case_sensitive=False)
         assert result == "hello world"
     
+    def test_lowercase_non_ascii_when_not_case_sensitive(self):
+        """Test that non-ASCII text gets full Unicode lowercasing."""
+        text = "Ñandú, ÉTÉ! Straße"
+        result = preprocess_text(text, case_sensitive=False)
+        assert result == "ñandú été straße"
+    
     def test_preserve_case_when_case_sensitive(self):
         """Test that case is preserved when case_sensitive is True."""
         text = "Hello WORLD"
@@ -117,6 +123,16 @@ class TestPreprocessText:
         assert 'hello' in result
         assert 'world' in result
     
+    def test_preserve_sentence_boundaries_exact_markers(self):
+        """Test that each delimiter yields one marker and other punctuation a space."""
+        text = "Hello. World! <b>Fine</b>; ok\nBye"
+        assert preprocess_text(text, case_sensitive=False, preserve_sentence_boundaries=True) == (
+            "hello sent world sent b fine b sent ok sent bye"
+        )
+        assert preprocess_text(text, case_sensitive=True, preserve_sentence_boundaries=True) == (
+            "Hello SENT World SENT b Fine b SENT ok SENT Bye"
+        )
+    
     def test_preserve_sentence_boundaries_false_removes_all_punct(self):
         """Test that when preserve_sentence_boundaries is False, all punctuation is removed as spaces."""
         text = "Hello. World! How are you?"
@@ -129,6 +145,27 @@ class TestPreprocessText:
         # Words should still be present, separated by spaces
         assert 'hello' in result
         assert 'world' in result
+    
+    @pytest.mark.parametrize("preserve_sentence_boundaries", [False, True])
+    @pytest.mark.parametrize("case_sensitive", [False, True])
+    def test_blockwise_matches_single_pass(self, monkeypatch, case_sensitive, preserve_sentence_boundaries):
+        """Test that text split into line blocks gives the same result as one pass."""
+        text = (
+            "Hello, World! covid-19 A4\n\n  Déjà vu; ÉTÉ 12:30?\r\n"
+            "Fine. <b>bold</b>\nlast line without break"
+        )
+        expected = preprocess_text(
+            text,
+            case_sensitive=case_sensitive,
+            preserve_sentence_boundaries=preserve_sentence_boundaries,
+        )
+        monkeypatch.setattr("src.text_processor._PREPROCESS_BLOCK_SIZE", 4)
+        result = preprocess_text(
+            text,
+            case_sensitive=case_sensitive,
+            preserve_sentence_boundaries=preserve_sentence_boundaries,
+        )
+        assert result == expected
 
 
 class TestGenerateWordCountFromText:
@@ -335,6 +372,18 @@ class TestRemoveExcludedText:
         result = remove_excluded_text(text, ["", "   ", "hello"], case_sensitive=False)
         assert "hello" not in result.lower()
         assert "world" in result.lower()
+    
+    def test_words_and_phrases_removed_in_order(self):
+        """Test that a phrase listed before its words is removed first, and after them is not."""
+        text = "hello world peace and world"
+        assert remove_excluded_text(text, ["world peace", "hello", "world"]) == " and "
+        assert remove_excluded_text(text, ["hello", "world", "world peace"]) == " peace and "
+    
+    def test_non_ascii_words_case_insensitive(self):
+        """Test that non-ASCII words are removed as whole words regardless of case."""
+        text = "Ñandú come ÉCLAIR y éclair; ñandú"
+        assert remove_excluded_text(text, ["ñandú", "éclair"], case_sensitive=False) == " come y ; "
+        assert remove_excluded_text(text, ["ñandú", "éclair"], case_sensitive=True) == "Ñandú come ÉCLAIR y ; "
 
 
 class TestApplyLiteralReplacements:
@@ -359,6 +408,24 @@ class TestApplyLiteralReplacements:
         replacements = [("this is a test", "")]
         result = apply_literal_replacements(text, replacements, case_sensitive=False)
         assert "this is a test" not in result.lower()
+    
+    def test_preserve_line_breaks(self):
+        """Test that a plain replacement keeps every line break."""
+        text = "Hello  world\nhello there\n\nbye hello"
+        result = apply_literal_replacements(text, [("hello", "hi")], case_sensitive=False)
+        assert result == "hi world\nhi there\n\nbye hi"
+    
+    def test_replacement_line_break_becomes_space(self):
+        """Test that a line break inside a replacement is folded into a space within its line."""
+        text = "one two\nthree two"
+        result = apply_literal_replacements(text, [("two", "2\n2")], case_sensitive=False)
+        assert result == "one 2 2\nthree 2 2"
+    
+    def test_replacement_escapes_and_group_references(self):
+        """Test that replacement escapes and group references are expanded per line."""
+        text = "one two\nthree two"
+        assert apply_literal_replacements(text, [("two", r"a\nb")]) == "one a b\nthree a b"
+        assert apply_literal_replacements(text, [("two", r"<\g<0>>")]) == "one <two>\nthree <two>"
 
 
 class TestParseExcludeWordsArgument:
@@ -449,6 +516,12 @@ class TestNormalizeBackreferences:
         input_str = 'P.\x01 Q.\x02 R.\x03'
         result = _normalize_backreferences(input_str)
         assert result == 'P.\\1 Q.\\2 R.\\3'
+    
+    def test_preserve_escaped_control_character(self):
+        """Test that a control character preceded by a backslash is left as-is."""
+        input_str = 'A\\\x01 B\x02'
+        result = _normalize_backreferences(input_str)
+        assert result == 'A\\\x01 B\\2'
 
 
 class TestParseRegexRuleArgument:
@@ -588,6 +661,26 @@ class TestApplyRegexTransformations:
         assert "página 2" not in result
         assert "Página 3" in result
     
+    def test_anchored_literal_removed_at_line_starts_only(self):
+        """Test that a ^-anchored plain pattern is removed only at the start of lines."""
+        text = "Intro Nota\nNota final"
+        rules = [RegexRule(pattern="^Nota", replacement=None)]
+        result = apply_regex_transformations(text, rules, case_sensitive=True)
+        assert result == "Intro Nota\n final"
+    
+    def test_absent_literal_leaves_text_unchanged(self):
+        """Test that a plain removal pattern missing from the text changes nothing."""
+        text = "nada que quitar"
+        rules = [RegexRule(pattern="Nota", replacement=None)]
+        assert apply_regex_transformations(text, rules, case_sensitive=True) == text
+    
+    def test_case_insensitive_literal_removed_in_any_case(self):
+        """Test that a plain pattern is still removed when its exact case is absent."""
+        text = "NOTA uno\nnota dos"
+        rules = [RegexRule(pattern="Nota", replacement=None)]
+        result = apply_regex_transformations(text, rules, case_sensitive=False)
+        assert result == " uno\n dos"
+    
     def test_backreferences_in_replacement(self):
         """Test that backreferences work in replacements."""
         text = "Autor: Juan Pérez\nTítulo: Mi Libro"